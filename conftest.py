@@ -1,34 +1,176 @@
+import hashlib
 import os
 import pytest
 from dotenv import load_dotenv
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 from pages.home_page import HomePage
 from pages.website import Website
-from playwright.sync_api import Browser, BrowserContext, Page, expect
+from playwright.sync_api import Browser, BrowserContext, Error, expect
 from pages.booking_page import BookingPage
+from pages.login_page import LoginPage
+from pages.aio.website import AsyncWebsite
+from plugins.asset_cache import install_asset_cache, install_asset_cache_async
+from plugins.browser_server import browser_server_endpoint
+from plugins.context_pool import pool_size, pool_stats
+from plugins.launch_profiles import get_profile_plugin
+from plugins.network import record_network
+from utils.async_runner import AsyncRunner
+from utils.context_pool import ContextPool
+from utils.page_reuse import PageReuse, reuse_group
+from utils.replay import install_replay, install_replay_async
+from utils.state_cache import StorageStateCache, apply_storage_state, session_shape, take_snapshot
+from utils.workers import worker_id, worker_stats
 
 
 load_dotenv()
 
+STATE_MAX_AGE = float(os.getenv("STATE_MAX_AGE", "3600"))
+LOGIN_RESTORE = os.getenv("LOGIN_RESTORE", "0") == "1"
+DEFAULT_CREDENTIALS = (os.getenv("LOGIN_USERNAME", "validUsername"), os.getenv("LOGIN_PASSWORD", "validPassword"))
+
+pytest_plugins = [
+    "plugins.durations",
+    "plugins.parallel",
+    "plugins.shards",
+    "plugins.wait_budget",
+    "plugins.replay",
+    "plugins.asset_cache",
+    "plugins.launch_profiles",
+    "plugins.browser_server",
+    "plugins.context_pool",
+    "plugins.profiler",
+    "plugins.affected_tests",
+    "plugins.known_bugs",
+    "plugins.timeouts",
+    "plugins.network",
+    "plugins.selector_check",
+]
+
+
+def configure_context(context: BrowserContext, config):
+    install_replay(context, config.getoption("replay"), config.getoption("replay_archive"))
+    install_asset_cache(context, config)
+    get_profile_plugin(config).profile.install(context)
+
+
+async def configure_async_context(context, config):
+    await install_replay_async(context, config.getoption("replay"), config.getoption("replay_archive"))
+    await install_asset_cache_async(context, config)
+    await get_profile_plugin(config).profile.install_async(context)
+
 
 @pytest.fixture(scope="session")
-def browser():
-    base_url = os.getenv("BASE_URL")
+def browser(pytestconfig):
     with sync_playwright() as p:
-        browser: Browser = p.chromium.launch(headless=False)
-        context: BrowserContext = browser.new_context(base_url=base_url)
-        yield context
-        context.close()
+        browser: Browser = None
+        endpoint = browser_server_endpoint(pytestconfig)
+        if endpoint is not None:
+            try:
+                browser = p.chromium.connect_over_cdp(endpoint)
+            except Error:
+                browser = None
+        if browser is None:
+            browser = p.chromium.launch(**get_profile_plugin(pytestconfig).launch_options())
+        yield browser
         browser.close()
 
 
+@pytest.fixture(scope="session")
+def context_pool(browser, pytestconfig):
+    base_url = os.getenv("BASE_URL")
+
+    def new_context():
+        context: BrowserContext = browser.new_context(base_url=base_url)
+        configure_context(context, pytestconfig)
+        return context
+
+    pool = ContextPool(new_context, pool_size(pytestconfig), stats=pool_stats())
+    pool.warm()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def async_runner():
+    runner = AsyncRunner()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_runner, pytestconfig):
+    playwright = async_runner.run(async_playwright().start())
+    browser = None
+    endpoint = browser_server_endpoint(pytestconfig)
+    if endpoint is not None:
+        try:
+            browser = async_runner.run(playwright.chromium.connect_over_cdp(endpoint))
+        except Error:
+            browser = None
+    if browser is None:
+        browser = async_runner.run(playwright.chromium.launch(**get_profile_plugin(pytestconfig).launch_options()))
+    yield browser
+    async_runner.run(browser.close())
+    async_runner.run(playwright.stop())
+
+
+@pytest.fixture
+def new_async_website(async_runner, async_browser, pytestconfig):
+    if pytestconfig.getoption("replay") == "record":
+        pytest.skip("Concurrent async pages cannot record into a single replay archive.")
+    contexts = []
+
+    async def new_async_website():
+        context = await async_browser.new_context(base_url=os.getenv("BASE_URL"))
+        contexts.append(context)
+        await configure_async_context(context, pytestconfig)
+        page = await context.new_page()
+        await page.goto("/")
+        return AsyncWebsite(page)
+
+    yield new_async_website
+    for context in contexts:
+        async_runner.run(context.close())
+
+
+@pytest.fixture(scope="session")
+def state_cache(pytestconfig):
+    return StorageStateCache(pytestconfig.cache.mkdir("easysend-state"), max_age=STATE_MAX_AGE)
+
+
+@pytest.fixture(scope="session")
+def page_reuse(context_pool):
+    page_reuse = PageReuse(context_pool, stats=worker_stats.setdefault("page_reuse", {}))
+    yield page_reuse
+    page_reuse.release()
+
+
+def sweep_group(request):
+    group = reuse_group(request.node)
+    return group if group is not None and group.startswith("sweep:") else None
+
+
 @pytest.fixture
-def website(browser):
-    page: Page = browser.new_page()
-    page.goto("/")
-    website = Website(page)
-    yield website
-    page.close()
+def website(request, context_pool, page_reuse):
+    group = sweep_group(request)
+    marker = request.node.get_closest_marker("reuse_page")
+    if group is not None:
+        context, page = page_reuse.acquire(group, reset=lambda reused_page: HomePage(reused_page).reset_ui())
+    elif marker is not None:
+        group = marker.kwargs.get("group", "read-only")
+        context, page = page_reuse.acquire(group, reset=lambda reused_page: HomePage(reused_page).reset_ui())
+    else:
+        page_reuse.release()
+        context, page = context_pool.acquire()
+
+    with record_network(request, page):
+        yield Website(page)
+
+    if group is None:
+        context_pool.release(context, page)
+    else:
+        page_reuse.hold(group, context, page)
 
 
 @pytest.fixture
@@ -43,12 +185,73 @@ def login_page(website):
     yield login_page
 
 
-@pytest.fixture
-def booking_page(home_page):
+def checkout_fingerprint(booking_page):
+    try:
+        return str(booking_page.get_total_price())
+    except (Error, ValueError):
+        return None
+
+
+def open_checkout(home_page, booking_page, state_cache, key):
+    entry = state_cache.load(key)
+    if entry is not None and entry.get("fingerprint") is not None:
+        apply_storage_state(home_page.page, entry["snapshot"])
+        home_page.page.goto("/checkout")
+        if booking_page.is_loaded() and checkout_fingerprint(booking_page) == entry["fingerprint"]:
+            return
+        home_page.page.goto("/")
+
     home_page.navigate_to_destinations_section()
     home_page.book_first_destination()
 
-    expect(home_page.page).to_have_url("https://demo.testim.io/checkout")
+    expect(home_page.page).to_have_url("/checkout")
+
+    fingerprint = checkout_fingerprint(booking_page)
+    if fingerprint is None:
+        state_cache.invalidate(key)
+        return
+    state_cache.refresh(key, take_snapshot(home_page.page), restore_failed=entry is not None,
+                        fingerprint=fingerprint)
 
+
+@pytest.fixture
+def booking_page(home_page, state_cache):
+    key = f"checkout:{os.getenv('BASE_URL')}:{worker_id()}"
     booking_page = BookingPage(home_page.page)
+    open_checkout(home_page, booking_page, state_cache, key)
     yield booking_page
+
+
+@pytest.fixture
+def authenticated_page(request, website, state_cache):
+    username, password = getattr(request, "param", DEFAULT_CREDENTIALS)
+    login_page = LoginPage(website.page)
+    if not LOGIN_RESTORE:
+        home_page = login_page.login(username, password)
+        expect(login_page.login_indicator).to_be_visible()
+        yield home_page
+        return
+
+    base_url = os.getenv("BASE_URL")
+    credentials = hashlib.sha256(f"{base_url}\0{username}\0{password}".encode()).hexdigest()
+    key = f"login:{credentials}"
+    shape_scope = f"login:{base_url}"
+
+    shape = state_cache.get_shape(shape_scope)
+    entry = state_cache.load(key, shape=shape) if shape is not None else None
+    if entry is not None:
+        apply_storage_state(website.page, entry["snapshot"])
+        website.page.goto("/")
+        if login_page.is_logged_in():
+            yield HomePage(website.page)
+            return
+
+    home_page = login_page.login(username, password)
+    expect(login_page.login_indicator).to_be_visible()
+
+    snapshot = take_snapshot(home_page.page)
+    current_shape = session_shape(snapshot)
+    if current_shape != shape:
+        state_cache.set_shape(shape_scope, current_shape)
+    state_cache.refresh(key, snapshot, restore_failed=entry is not None, shape=current_shape)
+    yield home_page
@@ -0,0 +1,13 @@
+# Generated from pages/base_page.py by `python -m utils.async_pages`. Do not edit.
+from utils.wait_budget import budget
+
+class AsyncBasePage:
+
+    def __init__(self, page):
+        self.page = page
+
+    async def go_to(self, url):
+        await self.page.goto(url)
+
+    def waiting(self):
+        return budget.waiting()
@@ -0,0 +1,119 @@
+# Generated from pages/booking_page.py by `python -m utils.async_pages`. Do not edit.
+import re
+from contextlib import asynccontextmanager
+from playwright.async_api import Error, expect
+from pages.aio.base_page import AsyncBasePage
+from pages.locators import BookingLocators
+from utils.prices import PriceChange, parse_price
+from utils.timeouts import timeouts
+from pages.booking_page import FILL_FORM_SCRIPT, TAG_FORM_FIELD_SCRIPT, FORM_FIELDS, OBSERVE_TOTAL_PRICE_SCRIPT, TOTAL_PRICE_CHANGE_SCRIPT, STOP_TOTAL_PRICE_SCRIPT
+
+class AsyncBookingPage(BookingLocators, AsyncBasePage):
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.destination_button = '#select-destination'
+
+    async def is_loaded(self, timeout=None):
+        try:
+            with timeouts.measure('booking_page.is_loaded', 2000, timeout) as timeout:
+                await expect(self.page).to_have_url('/checkout', timeout=timeout)
+                await expect(self.pay_now_button).to_be_visible(timeout=timeout)
+        except AssertionError:
+            return False
+        return True
+
+    async def agree_to_terms(self):
+        await self.terms_checkbox.click()
+
+    async def fill_form(self, name, email, ssn, phone, promo_code):
+        await self.name_field.fill(name)
+        await self.email_field.fill(email)
+        await self.ssn_field.fill(ssn)
+        await self.phone_field.fill(phone)
+        await self.promo_code_field.fill(promo_code)
+
+    async def fill_form_batched(self, name, email, ssn, phone, promo_code, agree_to_terms=None):
+        values = {'name': name, 'email': email, 'ssn': ssn, 'phone': phone, 'promo_code': promo_code, 'terms': agree_to_terms}
+        result = await self.checkout_form.evaluate_all(FILL_FORM_SCRIPT, values)
+        if result is None:
+            await self.tag_form_fields()
+            result = await self.checkout_form.evaluate_all(FILL_FORM_SCRIPT, values)
+        if result is None:
+            raise ValueError('Checkout form elements could not be matched to their field locators.')
+        return result
+
+    async def tag_form_fields(self):
+        for field, attribute in FORM_FIELDS.items():
+            await getattr(self, attribute).evaluate(TAG_FORM_FIELD_SCRIPT, field)
+
+    async def get_total_price(self):
+        return parse_price(await self.total_price_locator.text_content())
+
+    @asynccontextmanager
+    async def observe_total_price(self, action, timeout=None):
+        change = PriceChange(parse_price(await self.total_price_locator.evaluate(OBSERVE_TOTAL_PRICE_SCRIPT)))
+        try:
+            yield change
+        except BaseException:
+            await self.stop_observing_total_price()
+            raise
+        if timeout is None:
+            timeout = timeouts.timeout(f'booking_page.total_price_change.{action}', 2000)
+        try:
+            result = await self.page.evaluate(TOTAL_PRICE_CHANGE_SCRIPT, timeout)
+        except Error:
+            await self.stop_observing_total_price()
+            change.after = await self.get_total_price()
+            return
+        if not result['changed']:
+            change.after = change.before
+            return
+        timeouts.observe(f'booking_page.total_price_change.{action}', result['waited'])
+        change.after = parse_price(result['text']) if result['text'] is not None else await self.get_total_price()
+
+    async def stop_observing_total_price(self):
+        try:
+            await self.page.evaluate(STOP_TOTAL_PRICE_SCRIPT)
+        except Error:
+            pass
+
+    async def click_pay_now(self):
+        await self.pay_now_button.click()
+
+    async def is_error_dialog_visible(self):
+        return await self.error_dialog.is_visible()
+
+    async def get_error_dialog_text(self):
+        if await self.is_error_dialog_visible():
+            return (await self.error_dialog.text_content()).strip()
+        return None
+
+    async def click_apply_button(self):
+        await self.apply_button.click()
+
+    async def click_upload_box(self):
+        await self.dropzone_box.click()
+
+    async def upload_file(self, file_path):
+        await self.file_input.set_input_files(file_path)
+
+    async def has_booking_action_occurred(self, timeout_ms=None):
+        try:
+            with timeouts.measure('booking_page.has_booking_action_occurred', 3000, timeout_ms) as timeout_ms:
+                await expect(self.page).to_have_url('/confirmation', timeout=timeout_ms)
+            return True
+        except Exception:
+            pass
+        return await self.booking_confirmed.is_visible() or await self.payment_failed.is_visible()
+
+    async def get_travelers_count(self, timeout=None):
+        try:
+            with timeouts.measure('booking_page.get_travelers_count', 2000, timeout) as timeout:
+                travelers_text = await self.travelers_summary.text_content(timeout=timeout)
+        except Error as error:
+            raise ValueError('Travelers count not found on the page.') from error
+        match = re.search('(\\d+) travelers?', travelers_text or '')
+        if not match:
+            raise ValueError(f"Unexpected travelers summary '{travelers_text}'.")
+        return int(match.group(1))
@@ -0,0 +1,186 @@
+# Generated from pages/home_page.py by `python -m utils.async_pages`. Do not edit.
+import re
+from playwright.async_api import Error, expect
+from pages.aio.base_page import AsyncBasePage
+from pages.locators import SPACE_CARDS_SELECTOR, HomeLocators
+from utils.timeouts import timeouts
+from pages.home_page import CARDS_LOADED_SCRIPT, DATE_JUMP_SCRIPT, INITIAL_STATE_SCRIPT, SPACE_CARDS_SCRIPT
+
+class AsyncHomePage(HomeLocators, AsyncBasePage):
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.months = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
+
+    async def set_departing(self, date, navigate=False):
+        await self.set_date('departing', date, navigate)
+
+    async def set_returning(self, date, navigate=False):
+        await self.set_date('returning', date, navigate)
+
+    async def set_date(self, picker_type, date, navigate=False):
+        day, month, year = date.split('/')
+        month_name = self.months[int(month) - 1]
+        await self.open_date_picker(picker_type)
+        if not navigate and (not await self.jump_to_month(year, month_name)):
+            await self.close_date_picker()
+            await self.open_date_picker(picker_type)
+            navigate = True
+        if navigate:
+            await self.select_year(year)
+            await self.select_month(month_name)
+        await self.select_day(day, month, year)
+
+    async def jump_to_month(self, year, month):
+        try:
+            await self.page.evaluate(DATE_JUMP_SCRIPT, [str(year), self.months.index(month), self.months])
+        except Error:
+            return False
+        try:
+            with timeouts.measure('home_page.date_jump', 1000) as timeout:
+                await expect(self.month_locator).to_have_text(re.compile(f'^\\s*{month}\\s+{year}\\b'), timeout=timeout)
+        except AssertionError:
+            return False
+        return True
+
+    async def close_date_picker(self):
+        await self.page.keyboard.press('Escape')
+        if await self.dialog_cancel_button.is_visible():
+            await self.dialog_cancel_button.click()
+
+    async def open_date_picker(self, picker_type):
+        match picker_type:
+            case 'departing':
+                await self.date_inputs.nth(0).click()
+            case 'returning':
+                await self.date_inputs.nth(1).click()
+
+    async def select_year(self, year):
+        await self.years_button.click()
+        await self.year_option(year=year).click()
+
+    async def select_month(self, month):
+        current_month = await self.get_month()
+        current_month_index = self.months.index(current_month)
+        target_month_index = self.months.index(month)
+        times = abs(current_month_index - target_month_index)
+        direction = 'left' if current_month_index > target_month_index else 'right'
+        match direction:
+            case 'left':
+                for i in range(times):
+                    await self.month_left_button.click()
+            case 'right':
+                for i in range(times):
+                    await self.month_right_button.click()
+
+    async def get_month(self):
+        return (await self.month_locator.text_content()).split()[0].strip()
+
+    def is_valid_date(self, day, month, year):
+        day = int(day)
+        month = int(month)
+        year = int(year)
+        days_in_month = [31, 28 + (1 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 0), 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        return 1 <= month <= 12 and 1 <= day <= days_in_month[month - 1]
+
+    async def select_day_for_departing_or_returning(self, day):
+        if not await self.click_calendar_day(int(day) - 1):
+            raise AssertionError(f'Day {day} is not available in the calendar.')
+
+    async def click_calendar_day(self, day_index):
+        with self.waiting(), timeouts.measure('home_page.calendar', 5000) as timeout:
+            await self.calendar_days.first.wait_for(timeout=timeout)
+        if not 0 <= day_index < await self.calendar_days.count():
+            return False
+        await self.calendar_days.nth(day_index).click()
+        return True
+
+    async def select_day(self, day, month, year):
+        if not self.is_valid_date(day, month, year):
+            print(f'Skipped test due to invalid day input: {day}/{month}/{year} does not exist.')
+            return False
+        if not await self.click_calendar_day(int(day) - 1):
+            print(f'Could not click day {day} as it is not available in the calendar.')
+        return True
+
+    async def submit_selection(self):
+        await self.submit_selection_button.click()
+
+    async def select_adults(self, number):
+        await self.adults_dropdown.click()
+        option_locator = self.adults_options.filter(has_text=re.compile(f'^{number}$'))
+        if await option_locator.count() == 0:
+            raise AssertionError(f'No adults option with count {number} exists in the dropdown.')
+        await option_locator.click()
+
+    def get_selected_adults(self, expected_value):
+        return self.selected_adults_option.filter(has_text=expected_value)
+
+    async def select_children(self, number):
+        await self.children_dropdown.click()
+        try:
+            option_locator = self.children_option(number=number)
+            if await option_locator.count() == 0:
+                raise AssertionError(f'No children option with count {number} exists in the dropdown.')
+            with timeouts.measure('home_page.select_children', 2000) as timeout:
+                await option_locator.click(timeout=timeout)
+        except TimeoutError:
+            raise AssertionError(f'Timeout reached: No children option with count {number} exists in the dropdown.')
+
+    def get_selected_children(self, expected_value):
+        return self.selected_children_option.filter(has_text=expected_value)
+
+    async def is_in_initial_state(self, timeout=None):
+        try:
+            with self.waiting(), timeouts.measure('home_page.initial_state', 1000, timeout) as timeout:
+                await self.page.wait_for_function(INITIAL_STATE_SCRIPT, timeout=timeout)
+        except Error:
+            return False
+        return True
+
+    async def reset_ui(self):
+        await self.page.keyboard.press('Escape')
+        if await self.is_in_initial_state(timeout=300):
+            return True
+        if await self.dialog_cancel_button.is_visible():
+            await self.dialog_cancel_button.click()
+        await self.page.mouse.click(1, 1)
+        return await self.is_in_initial_state()
+
+    async def get_space_cards(self):
+        cards = await self.space_cards.evaluate_all(SPACE_CARDS_SCRIPT)
+        for card in cards:
+            if card['price'] is not None:
+                card['price'] = float(card['price'])
+        return cards
+
+    async def get_space_card_names(self):
+        return [card['name'] for card in await self.get_space_cards()]
+
+    async def load_more_space_cards(self):
+        if await self.load_more_button.is_visible():
+            await self.click_load_more()
+
+    async def click_load_more(self):
+        card_count = await self.space_cards.count()
+        await self.load_more_button.click()
+        with self.waiting():
+            await self.page.wait_for_function(CARDS_LOADED_SCRIPT, arg=[SPACE_CARDS_SELECTOR, card_count])
+
+    async def navigate_to_destinations_section(self):
+        await self.select_destination_button.click()
+        await expect(self.page).to_have_url('/destinations')
+
+    async def book_first_destination(self):
+        await self.book_button.click()
+        return self.booked_button
+
+    async def get_space_card_prices(self):
+        return {card['name']: card['price'] for card in await self.get_space_cards() if card['visible'] and card['price'] is not None}
+
+    async def fill_target_price(self, price):
+        await self.target_price_locator.fill(price)
+
+    async def load_all_space_cards(self):
+        while await self.load_more_button.is_enabled():
+            await self.click_load_more()
@@ -0,0 +1,56 @@
+# Generated from pages/login_page.py by `python -m utils.async_pages`. Do not edit.
+from pages.aio.base_page import AsyncBasePage
+from playwright.async_api import Page, expect
+from pages.aio.home_page import AsyncHomePage
+from pages.locators import LoginLocators
+from utils.timeouts import timeouts
+
+class AsyncLoginPage(LoginLocators, AsyncBasePage):
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    async def goto(self):
+        await self.login_button.click()
+
+    async def __fill_username(self, username):
+        await self._form_input_locator.nth(0).fill(username)
+
+    async def __fill_password(self, password):
+        await self._form_input_locator.nth(1).fill(password)
+
+    async def fill_credentials(self, username, password):
+        await self.__fill_username(username)
+        await self.__fill_password(password)
+
+    async def submit(self):
+        await self._submit_button.click()
+        return AsyncHomePage(self.page)
+
+    async def login(self, username, password):
+        await self.goto()
+        await self.fill_credentials(username, password)
+        return await self.submit()
+
+    async def is_username_error_visible(self):
+        return await self.username_error_locator.is_visible()
+
+    async def is_password_error_visible(self):
+        return await self.password_error_locator.is_visible()
+
+    async def check_username_error(self, expected_message):
+        assert await self.username_error_locator.text_content() == expected_message, 'Expected username error message not found'
+
+    async def check_password_error(self, expected_message):
+        assert await self.password_error_locator.text_content() == expected_message, 'Expected password error message not found'
+
+    async def is_login_persistent(self):
+        return await self.login_indicator.is_visible()
+
+    async def is_logged_in(self, timeout=None):
+        try:
+            with timeouts.measure('login_page.is_logged_in', 2000, timeout) as timeout:
+                await expect(self.login_indicator).to_be_visible(timeout=timeout)
+        except AssertionError:
+            return False
+        return True
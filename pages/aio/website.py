@@ -0,0 +1,13 @@
+# Generated from pages/website.py by `python -m utils.async_pages`. Do not edit.
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.login_page import AsyncLoginPage
+
+class AsyncWebsite(AsyncBasePage):
+
+    def __init__(self, page):
+        super().__init__(page)
+
+    async def goto_login(self):
+        login_page = AsyncLoginPage(self.page)
+        await login_page.goto()
+        return login_page
@@ -1,6 +1,12 @@
+from utils.wait_budget import budget
+
+
 class BasePage:
     def __init__(self, page):
         self.page = page
 
     def go_to(self, url):
         self.page.goto(url)
+
+    def waiting(self):
+        return budget.waiting()
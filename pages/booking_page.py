@@ -1,24 +1,94 @@
 import re
-from playwright.sync_api import expect
+from contextlib import contextmanager
+from playwright.sync_api import Error, expect
 from pages.base_page import BasePage
-
-
-class BookingPage(BasePage):
+from pages.locators import BookingLocators
+from utils.prices import PriceChange, parse_price
+from utils.timeouts import timeouts
+
+FILL_FORM_SCRIPT = """(elements, values) => {
+    const fields = elements.map(element => element.dataset.easysendField);
+    if (fields.includes(undefined) || Object.keys(values).some(field => !fields.includes(field))) {
+        return null;
+    }
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    const result = {};
+    elements.forEach((element, index) => {
+        const field = fields[index];
+        if (field === "terms") {
+            const checkbox = element.closest("label")?.control;
+            if (values.terms !== null && checkbox && checkbox.checked !== values.terms) {
+                element.click();
+            }
+            result.terms = Boolean(checkbox?.checked);
+            return;
+        }
+        element.focus();
+        setValue.call(element, values[field]);
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+        element.blur();
+        result[field] = element.value;
+    });
+    return result;
+}"""
+TAG_FORM_FIELD_SCRIPT = """(element, field) => {
+    element.dataset.easysendField = field;
+}"""
+FORM_FIELDS = {"name": "name_field", "email": "email_field", "ssn": "ssn_field", "phone": "phone_field",
+               "promo_code": "promo_code_field", "terms": "terms_checkbox"}
+OBSERVE_TOTAL_PRICE_SCRIPT = """element => {
+    const watch = {before: element.textContent, started: performance.now()};
+    watch.changed = new Promise(resolve => {
+        const settle = text => {
+            watch.changedAt ??= performance.now();
+            resolve(text);
+        };
+        watch.observer = new MutationObserver(() => {
+            if (!element.isConnected) {
+                settle(null);
+            } else if (element.textContent !== watch.before) {
+                settle(element.textContent);
+            }
+        });
+        watch.observer.observe(document.body, {characterData: true, childList: true, subtree: true});
+    });
+    window.__easysendTotalPrice = watch;
+    return watch.before;
+}"""
+TOTAL_PRICE_CHANGE_SCRIPT = """timeout => {
+    const watch = window.__easysendTotalPrice;
+    const remaining = Math.max(watch.started + timeout - performance.now(), 0);
+    const timedOut = new Promise(resolve => setTimeout(() => resolve(undefined), remaining));
+    return Promise.race([watch.changed, timedOut]).then(text => {
+        watch.observer.disconnect();
+        delete window.__easysendTotalPrice;
+        const changed = text !== undefined;
+        return {changed, text: text ?? null, waited: changed ? watch.changedAt - watch.started : null};
+    });
+}"""
+STOP_TOTAL_PRICE_SCRIPT = """() => {
+    const watch = window.__easysendTotalPrice;
+    if (watch) {
+        watch.observer.disconnect();
+        delete window.__easysendTotalPrice;
+    }
+}"""
+
+
+class BookingPage(BookingLocators, BasePage):
     def __init__(self, page):
         super().__init__(page)
-        self.name_field = page.locator("input[type='text'][maxlength='30']")
-        self.email_field = self.page.locator("input[type='email']")
-        self.ssn_field = page.locator("div").filter(has_text=re.compile(r"^Social Security Number$")).locator("input")
-        self.phone_field = self.page.locator("input[type='tel']")
-        self.promo_code_field = self.page.locator("input[name='promo']")
         self.destination_button = "#select-destination"
-        self.terms_checkbox = self.page.locator("label").filter(has_text="I agree to the terms and").locator("div")
-        self.total_price_locator = self.page.locator("div:has-text('Total') strong")
-        self.apply_button = self.page.locator("button:has-text('Apply')")
-        self.pay_now_button = self.page.locator("button:has-text('Pay now')")
-        self.error_dialog = self.page.locator("div[data-react-toolbox='dialog']")
-        self.dropzone_box = self.page.locator("div[class*='CustomerInfo__dropzone-box___27VMo']")
-        self.file_input = self.page.locator("input[type='file']")
+
+    def is_loaded(self, timeout=None):
+        try:
+            with timeouts.measure("booking_page.is_loaded", 2000, timeout) as timeout:
+                expect(self.page).to_have_url("/checkout", timeout=timeout)
+                expect(self.pay_now_button).to_be_visible(timeout=timeout)
+        except AssertionError:
+            return False
+        return True
 
     def agree_to_terms(self):
         self.terms_checkbox.click()
@@ -30,9 +100,52 @@ class BookingPage(BasePage):
         self.phone_field.fill(phone)
         self.promo_code_field.fill(promo_code)
 
+    def fill_form_batched(self, name, email, ssn, phone, promo_code, agree_to_terms=None):
+        values = {"name": name, "email": email, "ssn": ssn, "phone": phone, "promo_code": promo_code,
+                  "terms": agree_to_terms}
+        result = self.checkout_form.evaluate_all(FILL_FORM_SCRIPT, values)
+        if result is None:
+            self.tag_form_fields()
+            result = self.checkout_form.evaluate_all(FILL_FORM_SCRIPT, values)
+        if result is None:
+            raise ValueError("Checkout form elements could not be matched to their field locators.")
+        return result
+
+    def tag_form_fields(self):
+        for field, attribute in FORM_FIELDS.items():
+            getattr(self, attribute).evaluate(TAG_FORM_FIELD_SCRIPT, field)
+
     def get_total_price(self):
-        price_text = self.total_price_locator.text_content().strip().replace("$", "")
-        return price_text
+        return parse_price(self.total_price_locator.text_content())
+
+    @contextmanager
+    def observe_total_price(self, action, timeout=None):
+        change = PriceChange(parse_price(self.total_price_locator.evaluate(OBSERVE_TOTAL_PRICE_SCRIPT)))
+        try:
+            yield change
+        except BaseException:
+            self.stop_observing_total_price()
+            raise
+
+        if timeout is None:
+            timeout = timeouts.timeout(f"booking_page.total_price_change.{action}", 2000)
+        try:
+            result = self.page.evaluate(TOTAL_PRICE_CHANGE_SCRIPT, timeout)
+        except Error:
+            self.stop_observing_total_price()
+            change.after = self.get_total_price()
+            return
+        if not result["changed"]:
+            change.after = change.before
+            return
+        timeouts.observe(f"booking_page.total_price_change.{action}", result["waited"])
+        change.after = parse_price(result["text"]) if result["text"] is not None else self.get_total_price()
+
+    def stop_observing_total_price(self):
+        try:
+            self.page.evaluate(STOP_TOTAL_PRICE_SCRIPT)
+        except Error:
+            pass
 
     def click_pay_now(self):
         self.pay_now_button.click()
@@ -54,35 +167,27 @@ class BookingPage(BasePage):
     def upload_file(self, file_path):
         self.file_input.set_input_files(file_path)
 
-    def has_booking_action_occurred(self, timeout_ms=3000):
+    def has_booking_action_occurred(self, timeout_ms=None):
         try:
-            expect(self.page).to_have_url("https://demo.testim.io/confirmation", timeout=timeout_ms)
+            with timeouts.measure("booking_page.has_booking_action_occurred", 3000, timeout_ms) as timeout_ms:
+                expect(self.page).to_have_url("/confirmation", timeout=timeout_ms)
             return True
         except Exception:
             pass
 
         return (
-                self.page.locator("text='Booking confirmed!'").is_visible() or
-                self.page.locator("text='Payment failed.'").is_visible()
+                self.booking_confirmed.is_visible() or
+                self.payment_failed.is_visible()
         )
 
-    def get_travelers_count(self):
-        for count in range(1, 8):
-            traveler_text = f"{count} traveler" if count == 1 else f"{count} travelers"
-
-            try:
-                traveler_text_content = self.page.get_by_text(traveler_text, exact=True).text_content(timeout=2000).strip()
-
-                match = re.match(r"(\d+) traveler[s]?", traveler_text_content)
-                if match:
-                    travelers_count = int(match.group(1))
-                    return travelers_count
-
-            except Exception:
-                continue
-
-        raise ValueError("Travelers count not found on the page.")
-
-
-
-
+    def get_travelers_count(self, timeout=None):
+        try:
+            with timeouts.measure("booking_page.get_travelers_count", 2000, timeout) as timeout:
+                travelers_text = self.travelers_summary.text_content(timeout=timeout)
+        except Error as error:
+            raise ValueError("Travelers count not found on the page.") from error
+
+        match = re.search(r"(\d+) travelers?", travelers_text or "")
+        if not match:
+            raise ValueError(f"Unexpected travelers summary '{travelers_text}'.")
+        return int(match.group(1))
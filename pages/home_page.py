@@ -1,45 +1,103 @@
-from playwright.sync_api import expect
+import re
+from playwright.sync_api import Error, expect
 from pages.base_page import BasePage
-
-
-class HomePage(BasePage):
+from pages.locators import SPACE_CARDS_SELECTOR, HomeLocators
+from utils.timeouts import timeouts
+
+CARDS_LOADED_SCRIPT = """([selector, count]) => {
+    const button = [...document.querySelectorAll("button")].find(element => element.textContent.includes("Load more"));
+    return document.querySelectorAll(selector).length > count || !button || button.disabled;
+}"""
+DATE_JUMP_SCRIPT = """([year, monthIndex, months]) => {
+    document.querySelector("span#years").click();
+    document.querySelector(`ul > li[id='${year}']`).click();
+
+    const title = document.querySelector("span.theme__title___2Ue3-").textContent.trim().split(/\\s+/)[0];
+    const currentIndex = months.indexOf(title);
+    if (currentIndex < 0) {
+        throw new Error(`Unknown calendar month: ${title}`);
+    }
+    const direction = currentIndex > monthIndex ? "left" : "right";
+    for (let i = 0; i < Math.abs(currentIndex - monthIndex); i++) {
+        document.querySelector(`button[id='${direction}']`).click();
+    }
+}"""
+INITIAL_STATE_SCRIPT = """() => {
+    const isOpen = element => element.getBoundingClientRect().height > 0
+        && getComputedStyle(element).visibility !== "hidden" && getComputedStyle(element).opacity !== "0";
+    const dialogs = [...document.querySelectorAll("[data-react-toolbox='dialog']")].filter(isOpen);
+    const dropdowns = [...document.querySelectorAll("[data-react-toolbox='dropdown'] ul")].filter(isOpen);
+    return location.pathname === "/" && dialogs.length === 0 && dropdowns.length === 0;
+}"""
+SPACE_CARDS_SCRIPT = """cards => {
+    const isVisible = element => {
+        if (!element) return false;
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== "hidden";
+    };
+
+    return cards.map(card => {
+        const title = card.querySelector("div[class*='GalleryItem__cardTitle']");
+        const priceTag = card.querySelector("span.GalleryItem__price-tag___3q0Al");
+        const name = title ? title.textContent.trim() : card.textContent.trim().split(/\\r?\\n/)[0];
+        const price = isVisible(title) && isVisible(priceTag) ? priceTag.textContent.trim().replace("$", "") : null;
+        return {name, price, visible: isVisible(card)};
+    });
+}"""
+
+
+class HomePage(HomeLocators, BasePage):
     def __init__(self, page):
         super().__init__(page)
         self.months = ["January", "February", "March", "April", "May", "June", "July",
                         "August", "September", "October", "November", "December"]
-        self.month_locator = self.page.locator("span.theme__title___2Ue3-").nth(0)
-        self.adults_dropdown = self.page.locator("div[data-react-toolbox='dropdown']").nth(0)
-        self.children_dropdown = self.page.locator("div[data-react-toolbox='dropdown']").nth(1)
-        self.load_more_button = self.page.locator("button:has-text('Load more')")
-        self.slider_knob = self.page.locator("div.theme__knob____QAHG.PurpleSlider__knob___lSlRq")
-        self.slider_inner = self.page.locator("div.theme__innerknob___20XNj.PurpleSlider__innerknob___2wxLd")
-        self.target_price_locator = self.page.locator(
-            "input[class*='theme__inputElement___27dyY theme__filled___1UI7Z']:not([name])")
-
-    def set_departing(self, date):
-        day, month, year = date.split("/")
-        self.open_date_picker("departing")
-        self.select_year(year)
-        self.select_month(self.months[int(month) - 1])
-        self.select_day(day, month, year)
 
-    def set_returning(self, date):
+    def set_departing(self, date, navigate=False):
+        self.set_date("departing", date, navigate)
+
+    def set_returning(self, date, navigate=False):
+        self.set_date("returning", date, navigate)
+
+    def set_date(self, picker_type, date, navigate=False):
         day, month, year = date.split("/")
-        self.open_date_picker("returning")
-        self.select_year(year)
-        self.select_month(self.months[int(month) - 1])
+        month_name = self.months[int(month) - 1]
+        self.open_date_picker(picker_type)
+        if not navigate and not self.jump_to_month(year, month_name):
+            self.close_date_picker()
+            self.open_date_picker(picker_type)
+            navigate = True
+        if navigate:
+            self.select_year(year)
+            self.select_month(month_name)
         self.select_day(day, month, year)
 
+    def jump_to_month(self, year, month):
+        try:
+            self.page.evaluate(DATE_JUMP_SCRIPT, [str(year), self.months.index(month), self.months])
+        except Error:
+            return False
+        try:
+            with timeouts.measure("home_page.date_jump", 1000) as timeout:
+                expect(self.month_locator).to_have_text(re.compile(rf"^\s*{month}\s+{year}\b"), timeout=timeout)
+        except AssertionError:
+            return False
+        return True
+
+    def close_date_picker(self):
+        self.page.keyboard.press("Escape")
+        if self.dialog_cancel_button.is_visible():
+            self.dialog_cancel_button.click()
+
     def open_date_picker(self, picker_type):
         match picker_type:
             case "departing":
-                self.page.locator("input[role='input']").nth(0).click()
+                self.date_inputs.nth(0).click()
             case "returning":
-                self.page.locator("input[role='input']").nth(1).click()
+                self.date_inputs.nth(1).click()
 
     def select_year(self, year):
-        self.page.locator("span#years").click()
-        self.page.locator(f"ul > li[id=\'{year}\']").click()
+        self.years_button.click()
+        self.year_option(year=year).click()
 
     def select_month(self, month):
         current_month = self.get_month()
@@ -52,10 +110,10 @@ class HomePage(BasePage):
         match direction:
             case "left":
                 for i in range(times):
-                    self.page.locator("button[id='left']").click()
+                    self.month_left_button.click()
             case "right":
                 for i in range(times):
-                    self.page.locator("button[id='right']").click()
+                    self.month_right_button.click()
 
     def get_month(self):
         return self.month_locator.text_content().split()[0].strip()
@@ -70,108 +128,108 @@ class HomePage(BasePage):
         return 1 <= month <= 12 and 1 <= day <= days_in_month[month - 1]
 
     def select_day_for_departing_or_returning(self, day):
-        self.page.locator("div.theme__day___3cb3g > span").nth(int(day) - 1).click(timeout=1000)
+        if not self.click_calendar_day(int(day) - 1):
+            raise AssertionError(f"Day {day} is not available in the calendar.")
+
+    def click_calendar_day(self, day_index):
+        with self.waiting(), timeouts.measure("home_page.calendar", 5000) as timeout:
+            self.calendar_days.first.wait_for(timeout=timeout)
+        if not 0 <= day_index < self.calendar_days.count():
+            return False
+        self.calendar_days.nth(day_index).click()
+        return True
 
     def select_day(self, day, month, year):
         if not self.is_valid_date(day, month, year):
             print(f"Skipped test due to invalid day input: {day}/{month}/{year} does not exist.")
             return False
-        day_index = int(day) - 1
-        try:
-            self.page.locator("div.theme__day___3cb3g > span").nth(day_index).click(timeout=1000)
-        except TimeoutError:
+        if not self.click_calendar_day(int(day) - 1):
             print(f"Could not click day {day} as it is not available in the calendar.")
         return True
 
     def submit_selection(self):
-        self.page.locator(".theme__button___1iKuo.theme__flat___2ui7t.theme__neutral___uDC3j.theme__button___3HGWm.theme__button___14VKJ").nth(1).click()
+        self.submit_selection_button.click()
 
     def select_adults(self, number):
         self.adults_dropdown.click()
-        self.page.get_by_text(str(number), exact=True).first.click(timeout=500)
+        option_locator = self.adults_options.filter(has_text=re.compile(rf"^{number}$"))
+        if option_locator.count() == 0:
+            raise AssertionError(f"No adults option with count {number} exists in the dropdown.")
+
+        option_locator.click()
 
     def get_selected_adults(self, expected_value):
-        return self.page.locator(
-            "li.theme__selected___2Uc3r.WhiteDropDown__selected___3y0b0"
-        ).filter(has_text=expected_value)
+        return self.selected_adults_option.filter(has_text=expected_value)
 
     def select_children(self, number):
         self.children_dropdown.click()
         try:
-            option_locator = self.page.get_by_text(str(number), exact=True).nth(1)
+            option_locator = self.children_option(number=number)
             if option_locator.count() == 0:
                 raise AssertionError(f"No children option with count {number} exists in the dropdown.")
 
-            option_locator.click(timeout=2000)
+            with timeouts.measure("home_page.select_children", 2000) as timeout:
+                option_locator.click(timeout=timeout)
         except TimeoutError:
             raise AssertionError(f"Timeout reached: No children option with count {number} exists in the dropdown.")
 
     def get_selected_children(self, expected_value):
-        return self.children_dropdown.locator(
-            "li.theme__selected___2Uc3r.WhiteDropDown__selected___3y0b0"
-        ).filter(has_text=expected_value)
+        return self.selected_children_option.filter(has_text=expected_value)
 
-    def get_space_card_names(self):
-        space_cards = self.page.locator("div[class*='GalleryItem__gallery-item']")
-        space_names = []
+    def is_in_initial_state(self, timeout=None):
+        try:
+            with self.waiting(), timeouts.measure("home_page.initial_state", 1000, timeout) as timeout:
+                self.page.wait_for_function(INITIAL_STATE_SCRIPT, timeout=timeout)
+        except Error:
+            return False
+        return True
 
-        for i in range(space_cards.count()):
-            card = space_cards.nth(i)
-            name_element = card.locator("div[class*='GalleryItem__cardTitle']")
+    def reset_ui(self):
+        self.page.keyboard.press("Escape")
+        if self.is_in_initial_state(timeout=300):
+            return True
 
-            if name_element.count() > 0:
-                space_name = name_element.text_content().strip()
-            else:
-                full_text = card.text_content().strip()
-                space_name = full_text.splitlines()[0]
+        if self.dialog_cancel_button.is_visible():
+            self.dialog_cancel_button.click()
+        self.page.mouse.click(1, 1)
+        return self.is_in_initial_state()
 
-            space_names.append(space_name)
+    def get_space_cards(self):
+        cards = self.space_cards.evaluate_all(SPACE_CARDS_SCRIPT)
+        for card in cards:
+            if card["price"] is not None:
+                card["price"] = float(card["price"])
+        return cards
 
-        return space_names
+    def get_space_card_names(self):
+        return [card["name"] for card in self.get_space_cards()]
 
     def load_more_space_cards(self):
         if self.load_more_button.is_visible():
-            self.load_more_button.click()
-            self.page.wait_for_timeout(1000)
+            self.click_load_more()
 
+    def click_load_more(self):
+        card_count = self.space_cards.count()
+        self.load_more_button.click()
+        with self.waiting():
+            self.page.wait_for_function(CARDS_LOADED_SCRIPT, arg=[SPACE_CARDS_SELECTOR, card_count])
 
     def navigate_to_destinations_section(self):
-        self.page.locator("button:has-text('Select Destination')").click()
-        expect(self.page).to_have_url("https://demo.testim.io/destinations")
+        self.select_destination_button.click()
+        expect(self.page).to_have_url("/destinations")
 
     def book_first_destination(self):
-        book_button = self.page.locator("div button:has-text('Book')").first
-        book_button.click()
-
-        return self.page.locator("div button:has-text('Booked')").first
+        self.book_button.click()
+        return self.booked_button
 
     def get_space_card_prices(self):
-        space_cards = self.page.locator("div[class*='GalleryItem__gallery-item']")
-        space_prices = {}
-
-        for i in range(space_cards.count()):
-            card = space_cards.nth(i)
-            if card.is_visible():
-                try:
-                    name_element = card.locator("div[class*='GalleryItem__cardTitle']")
-                    price_element = card.locator("span.GalleryItem__price-tag___3q0Al")
-
-                    if name_element.is_visible() and price_element.is_visible():
-                        name = name_element.text_content(timeout=2000).strip()
-                        price_text = price_element.text_content(timeout=2000).strip().replace("$", "")
-                        price = float(price_text)
-                        space_prices[name] = price
-                except TimeoutError:
-                    print(f"Failed to retrieve data for space card index {i}. Retrying...")
-                    continue
-
-        return space_prices
+        return {card["name"]: card["price"] for card in self.get_space_cards()
+                if card["visible"] and card["price"] is not None}
 
     def fill_target_price(self, price):
         self.target_price_locator.fill(price)
 
     def load_all_space_cards(self):
         while self.load_more_button.is_enabled():
-            self.load_more_button.click()
-            self.page.wait_for_timeout(500)
+            self.click_load_more()
 
@@ -0,0 +1,181 @@
+import re
+import string
+
+SPACE_CARDS_SELECTOR = "div[class*='GalleryItem__gallery-item']"
+SELECTED_OPTION = "li.theme__selected___2Uc3r.WhiteDropDown__selected___3y0b0"
+DIALOG = "div[data-react-toolbox='dialog']"
+DROPDOWN = "div[data-react-toolbox='dropdown']"
+
+
+class LocatorSpec:
+    listeners = []
+
+    def __init__(self, steps=(), state=None, required=True, sources=()):
+        self.steps = steps
+        self.state = state
+        self.required = required
+        self.sources = sources
+        self.name = None
+        self.key = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.key = f"{owner.__module__}:{owner.__qualname__}.{name}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        for listener in self.listeners:
+            listener(self)
+        if self.fields:
+            return lambda **values: self.format(**values).resolve(instance.page)
+        locator = self.resolve(instance.page)
+        instance.__dict__[self.name] = locator
+        return locator
+
+    def _derive(self, steps=None, state=None, required=None, sources=()):
+        return LocatorSpec(self.steps if steps is None else steps, self.state if state is None else state,
+                           self.required if required is None else required, (self, *sources))
+
+    def _chain(self, method, *args, **kwargs):
+        return self._derive((*self.steps, (method, args, kwargs)),
+                            sources=[arg for arg in args if isinstance(arg, LocatorSpec)])
+
+    def locator(self, selector, **kwargs):
+        return self._chain("locator", selector, **kwargs)
+
+    def get_by_role(self, role, **kwargs):
+        return self._chain("get_by_role", role, **kwargs)
+
+    def get_by_text(self, text, **kwargs):
+        return self._chain("get_by_text", text, **kwargs)
+
+    def filter(self, **kwargs):
+        return self._chain("filter", **kwargs)
+
+    def nth(self, index):
+        return self._chain("nth", index)
+
+    def or_(self, other):
+        return self._chain("or_", other)
+
+    @property
+    def first(self):
+        return self._derive((*self.steps, ("first", None, None)))
+
+    def after(self, state):
+        return self._derive(state=state)
+
+    def optional(self):
+        return self._derive(required=False)
+
+    @property
+    def fields(self):
+        return {field for _, args, _ in self.steps for arg in args or () if isinstance(arg, str)
+                for _, field, _, _ in string.Formatter().parse(arg) if field}
+
+    def format(self, **values):
+        steps = tuple((method, tuple(arg.format(**values) if isinstance(arg, str) else arg for arg in args or ())
+                       if args is not None else None, kwargs) for method, args, kwargs in self.steps)
+        return self._derive(steps)
+
+    def dependencies(self):
+        keys = {self.key} if self.key is not None else set()
+        for source in self.sources:
+            keys |= source.dependencies()
+        return keys
+
+    def resolve(self, page):
+        target = page
+        for method, args, kwargs in self.steps:
+            if args is None:
+                target = getattr(target, method)
+                continue
+            args = [arg.resolve(page) if isinstance(arg, LocatorSpec) else arg for arg in args]
+            target = getattr(target, method)(*args, **kwargs)
+        return target
+
+    def __repr__(self):
+        parts = []
+        for method, args, kwargs in self.steps:
+            if args is None:
+                parts.append(method)
+                continue
+            arguments = [repr(arg) for arg in args] + [f"{name}={value!r}" for name, value in kwargs.items()]
+            parts.append(f"{method}({', '.join(arguments)})")
+        return ".".join(parts)
+
+
+PAGE = LocatorSpec()
+
+
+class HomeLocators:
+    default_state = "home"
+
+    month_locator = PAGE.locator("span.theme__title___2Ue3-").nth(0).after("date picker")
+    calendar_days = PAGE.locator("div.theme__day___3cb3g > span").after("date picker")
+    date_inputs = PAGE.locator("input[role='input']")
+    years_button = PAGE.locator("span#years").after("date picker")
+    year_option = PAGE.locator("ul > li[id='{year}']").after("year list")
+    month_left_button = PAGE.locator("button[id='left']").after("date picker")
+    month_right_button = PAGE.locator("button[id='right']").after("date picker")
+    submit_selection_button = PAGE.locator(
+        ".theme__button___1iKuo.theme__flat___2ui7t.theme__neutral___uDC3j.theme__button___3HGWm.theme__button___14VKJ"
+    ).nth(1).after("date picker")
+    dialog_cancel_button = PAGE.locator(f"{DIALOG} nav button").first.after("date picker")
+
+    adults_dropdown = PAGE.locator(DROPDOWN).nth(0)
+    adults_options = adults_dropdown.locator("li").after("adults dropdown")
+    selected_adults_option = PAGE.locator(SELECTED_OPTION).after("adults dropdown")
+    children_dropdown = PAGE.locator(DROPDOWN).nth(1)
+    children_option = PAGE.get_by_text("{number}", exact=True).nth(1).after("children dropdown")
+    selected_children_option = children_dropdown.locator(SELECTED_OPTION).after("children dropdown")
+
+    load_more_button = PAGE.locator("button:has-text('Load more')")
+    space_cards = PAGE.locator(SPACE_CARDS_SELECTOR)
+    slider_knob = PAGE.locator("div.theme__knob____QAHG.PurpleSlider__knob___lSlRq")
+    slider_inner = PAGE.locator("div.theme__innerknob___20XNj.PurpleSlider__innerknob___2wxLd")
+    target_price_locator = PAGE.locator("input[class*='theme__inputElement___27dyY theme__filled___1UI7Z']:not([name])")
+    select_destination_button = PAGE.locator("button:has-text('Select Destination')")
+    book_button = PAGE.locator("div button:has-text('Book')").first.after("destinations")
+    booked_button = PAGE.locator("div button:has-text('Booked')").first.optional()
+
+
+class BookingLocators:
+    default_state = "checkout"
+
+    name_field = PAGE.locator("input[type='text'][maxlength='30']")
+    email_field = PAGE.locator("input[type='email']")
+    ssn_field = PAGE.locator("div").filter(has_text=re.compile(r"^Social Security Number$")).locator("input")
+    phone_field = PAGE.locator("input[type='tel']")
+    promo_code_field = PAGE.locator("input[name='promo']")
+    terms_checkbox = PAGE.locator("label").filter(has_text="I agree to the terms and").locator("div")
+    total_price_locator = PAGE.locator("div:has-text('Total') strong")
+    apply_button = PAGE.locator("button:has-text('Apply')")
+    pay_now_button = PAGE.locator("button:has-text('Pay now')")
+    error_dialog = PAGE.locator(DIALOG).optional()
+    dropzone_box = PAGE.locator("div[class*='CustomerInfo__dropzone-box___27VMo']")
+    file_input = PAGE.locator("input[type='file']")
+    travelers_summary = PAGE.get_by_text(re.compile(r"^\d+ travelers?$")).first
+    booking_confirmed = PAGE.locator("text='Booking confirmed!'").optional()
+    payment_failed = PAGE.locator("text='Payment failed.'").optional()
+    checkout_form = (name_field.or_(email_field).or_(ssn_field).or_(phone_field).or_(promo_code_field)
+                     .or_(terms_checkbox))
+
+
+class LoginLocators:
+    default_state = "home"
+
+    login_button = PAGE.locator("button:has-text('Log in')")
+    _form_input_locator = PAGE.locator("form#login input").after("login form")
+    _submit_button = PAGE.get_by_role("navigation").get_by_role("button", name="Log in").after("login form")
+    username_error_locator = PAGE.locator("text='Name is a required field.'").optional()
+    password_error_locator = PAGE.locator("text='Password is a required field.'").optional()
+    login_indicator = PAGE.locator("button span:has-text('Hello, John')").optional()
+
+
+LOCATOR_GROUPS = (HomeLocators, BookingLocators, LoginLocators)
+
+
+def locator_specs(group):
+    return {name: value for name, value in vars(group).items() if isinstance(value, LocatorSpec)}
@@ -1,33 +1,36 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 from pages.home_page import HomePage
+from pages.locators import LoginLocators
+from utils.timeouts import timeouts
 
 
-class LoginPage(BasePage):
+class LoginPage(LoginLocators, BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
-        self.__form_input_locator = self.page.locator("form#login input")
-        self.__submit_button = self.page.get_by_role("navigation").get_by_role("button", name="Log in")
-        self.username_error_locator = self.page.locator("text='Name is a required field.'")
-        self.password_error_locator = self.page.locator("text='Password is a required field.'")
 
     def goto(self):
-        self.page.locator("button:has-text('Log in')").click()
+        self.login_button.click()
 
     def __fill_username(self, username):
-        self.__form_input_locator.nth(0).fill(username)
+        self._form_input_locator.nth(0).fill(username)
 
     def __fill_password(self, password):
-        self.__form_input_locator.nth(1).fill(password)
+        self._form_input_locator.nth(1).fill(password)
 
     def fill_credentials(self, username, password):
         self.__fill_username(username)
         self.__fill_password(password)
 
     def submit(self):
-        self.__submit_button.click()
+        self._submit_button.click()
         return HomePage(self.page)
 
+    def login(self, username, password):
+        self.goto()
+        self.fill_credentials(username, password)
+        return self.submit()
+
     def is_username_error_visible(self):
         return self.username_error_locator.is_visible()
 
@@ -43,6 +46,13 @@ class LoginPage(BasePage):
             "Expected password error message not found"
 
     def is_login_persistent(self):
-        login_indicator = self.page.locator("button span:has-text('Hello, John')")
-        return login_indicator.is_visible()
+        return self.login_indicator.is_visible()
+
+    def is_logged_in(self, timeout=None):
+        try:
+            with timeouts.measure("login_page.is_logged_in", 2000, timeout) as timeout:
+                expect(self.login_indicator).to_be_visible(timeout=timeout)
+        except AssertionError:
+            return False
+        return True
 
@@ -0,0 +1,93 @@
+import os
+import subprocess
+
+import pytest
+from pages.aio.base_page import AsyncBasePage
+from pages.base_page import BasePage
+from pages.locators import LocatorSpec
+from utils.affected_tests import INDEX_KEY, ChangeSet, DependencyRecorder, git_changes
+from utils.workers import is_worker, worker_stats
+
+PLUGIN_NAME = "easysend-affected-tests"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("affected-tests", "affected test selection")
+    group.addoption("--changed-since", default=os.getenv("CHANGED_SINCE"), metavar="REF",
+                    help="Only run tests affected by changes since the merge base with REF, e.g. origin/main "
+                         "(CHANGED_SINCE). Changes outside pages/ and tests/ run the full suite.")
+
+
+class SelectionPlugin:
+    def __init__(self, config):
+        self.config = config
+        self.recorder = DependencyRecorder(stats=worker_stats.setdefault("test_dependencies", {}))
+        self.recorder.install(BasePage, AsyncBasePage)
+        LocatorSpec.listeners.append(self.record_locator)
+        self.called = set()
+        self.summary = None
+
+    def record_locator(self, spec):
+        for key in spec.dependencies():
+            self.recorder.record(key)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.recorder.start(item.nodeid)
+        yield
+        self.recorder.stop()
+        if item.nodeid not in self.called:
+            self.recorder.discard(item.nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call":
+            self.called.add(report.nodeid)
+
+    def pytest_collection_modifyitems(self, config, items):
+        ref = config.getoption("changed_since")
+        if not ref or is_worker():
+            return
+
+        index = config.cache.get(INDEX_KEY, {})
+        if not index:
+            self.summary = "full suite, no dependency index recorded yet"
+            return
+        try:
+            changes = ChangeSet(config.rootpath, git_changes(config.rootpath, ref))
+        except (OSError, subprocess.CalledProcessError) as error:
+            self.summary = f"full suite, could not diff against {ref}: {error}"
+            return
+        if changes.full_suite_reason is not None:
+            self.summary = f"full suite, {changes.full_suite_reason}"
+            return
+
+        selected, deselected = [], []
+        for item in items:
+            watched_paths = [path for marker in item.iter_markers("depends_on") for path in marker.args]
+            if changes.affects(item.nodeid, index.get(item.nodeid), watched_paths):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.summary = f"{len(selected)} of {len(selected) + len(deselected)} tests affected by changes since {ref}"
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        dependencies = worker_stats.get("test_dependencies")
+        if is_worker() or not dependencies or getattr(self.config, "cache", None) is None:
+            return
+        index = self.config.cache.get(INDEX_KEY, {})
+        for nodeid, calls in dependencies.items():
+            index[nodeid] = sorted(set(index.get(nodeid, [])) | set(calls))
+        self.config.cache.set(INDEX_KEY, index)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.summary is not None:
+            terminalreporter.write_sep("-", "test selection")
+            terminalreporter.write_line(self.summary)
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(SelectionPlugin(config), PLUGIN_NAME)
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+from utils.asset_cache import AssetCache
+from utils.workers import worker_stats
+
+PLUGIN_NAME = "easysend-asset-cache"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("asset-cache", "static asset cache")
+    group.addoption("--no-asset-cache", action="store_true", default=os.getenv("ASSET_CACHE", "1") == "0",
+                    help="Do not serve static assets from the on-disk cache (ASSET_CACHE=0).")
+    group.addoption("--asset-cache-size", type=int, default=int(os.getenv("ASSET_CACHE_SIZE_MB", "200")),
+                    metavar="MB", help="Size limit of the asset cache, least recently used assets are evicted first.")
+
+
+class AssetCachePlugin:
+    def __init__(self, config):
+        self.cache = AssetCache(config.cache.mkdir("easysend-assets"),
+                                max_bytes=config.getoption("asset_cache_size") * 1024 * 1024,
+                                stats=worker_stats.setdefault("asset_cache", {}))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        stats = self.cache.stats
+        requests = stats["hits"] + stats["misses"]
+        if not requests:
+            return
+        terminalreporter.write_sep("-", "static asset cache")
+        terminalreporter.write_line(
+            f"{stats['hits']} hits, {stats['misses']} misses ({100 * stats['hits'] / requests:.1f}% hit rate), "
+            f"{stats['bytes_served'] / 1024 / 1024:.1f} MB served from cache, "
+            f"{stats['stored']} assets stored, {stats['evicted']} evicted")
+
+
+def install_asset_cache(context, config):
+    plugin = config.pluginmanager.get_plugin(PLUGIN_NAME)
+    if plugin is not None:
+        plugin.cache.install(context)
+
+
+async def install_asset_cache_async(context, config):
+    plugin = config.pluginmanager.get_plugin(PLUGIN_NAME)
+    if plugin is not None:
+        await plugin.cache.install_async(context)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if config.getoption("no_asset_cache") or config.getoption("replay") != "off":
+        return
+    if getattr(config, "cache", None) is None:
+        return
+    config.pluginmanager.register(AssetCachePlugin(config), PLUGIN_NAME)
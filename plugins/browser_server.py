@@ -0,0 +1,19 @@
+import os
+
+from plugins.launch_profiles import get_profile_plugin
+from utils.browser_server import DEFAULT_STATE_FILE, running_endpoint
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("browser-server", "persistent browser server")
+    group.addoption("--browser-server", choices=("auto", "off"), default=os.getenv("BROWSER_SERVER", "auto"),
+                    help="'auto' connects to a running `python -m utils.browser_server` with the same launch "
+                         "profile and launches a browser otherwise (BROWSER_SERVER).")
+    group.addoption("--browser-server-state", default=os.getenv("BROWSER_SERVER_STATE", DEFAULT_STATE_FILE),
+                    help="State file the browser server publishes its endpoint in.")
+
+
+def browser_server_endpoint(config):
+    if config.getoption("browser_server") == "off":
+        return None
+    return running_endpoint(config.getoption("browser_server_state"), get_profile_plugin(config).launch_options())
@@ -0,0 +1,35 @@
+import os
+
+from utils.workers import worker_stats
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("context-pool", "browser context pool")
+    group.addoption("--context-pool-size", type=int, default=int(os.getenv("CONTEXT_POOL_SIZE", "2")),
+                    help="Number of pre-warmed browser contexts kept ready for tests (CONTEXT_POOL_SIZE).")
+
+
+def pool_size(config):
+    if config.getoption("replay") == "record":
+        return 1
+    return config.getoption("context_pool_size")
+
+
+def pool_stats():
+    return worker_stats.setdefault("context_pool", {})
+
+
+def pytest_terminal_summary(terminalreporter):
+    stats = worker_stats.get("context_pool")
+    if not stats or not stats.get("acquired"):
+        return
+    terminalreporter.write_sep("-", "browser context pool")
+    terminalreporter.write_line(
+        f"{stats['acquired']} contexts handed out, {stats['created']} created, {stats['recycled']} recycled, "
+        f"{stats['discarded']} discarded; waited {stats['wait_seconds']:.2f}s in total, "
+        f"{stats['wait_seconds'] / stats['acquired']:.3f}s on average, {stats['max_wait_seconds']:.2f}s at most")
+
+    reuse = worker_stats.get("page_reuse")
+    if reuse and (reuse["reused"] or reuse["reloaded"]):
+        terminalreporter.write_line(f"read-only tests reused a loaded page {reuse['reused']} times, "
+                                    f"{reuse['reloaded']} resets fell back to a reload")
@@ -0,0 +1,26 @@
+import pytest
+from utils.durations import DurationStore
+from utils.workers import is_worker
+
+PLUGIN_NAME = "easysend-durations"
+
+
+class DurationRecorder:
+    def __init__(self, config):
+        self.store = DurationStore(getattr(config, "cache", None))
+
+    def pytest_runtest_logreport(self, report):
+        self.store.add(report.nodeid, report.duration)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        if not is_worker():
+            self.store.save()
+
+
+def get_store(config):
+    return config.pluginmanager.get_plugin(PLUGIN_NAME).store
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(DurationRecorder(config), PLUGIN_NAME)
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+from utils.known_bugs import KnownBugRegistry, known_bug
+from utils.workers import is_worker, worker_stats
+
+PLUGIN_NAME = "easysend-known-bugs"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("known-bugs", "known bug deduplication")
+    group.addoption("--no-known-bugs", action="store_true", default=os.getenv("KNOWN_BUGS", "1") == "0",
+                    help="Run every xfail case in full (KNOWN_BUGS=0).")
+    group.addoption("--recheck-known-bugs", action="store_true", default=False,
+                    help="Run every xfail case in full and restart the re-check interval.")
+    group.addoption("--known-bug-recheck-hours", type=float,
+                    default=float(os.getenv("KNOWN_BUG_RECHECK_HOURS", "24")),
+                    help="Hours between full runs of every xfail case (KNOWN_BUG_RECHECK_HOURS).")
+
+
+class KnownBugsPlugin:
+    def __init__(self, config):
+        self.registry = KnownBugRegistry(getattr(config, "cache", None),
+                                         recheck_seconds=config.getoption("known_bug_recheck_hours") * 3600,
+                                         force_recheck=config.getoption("recheck_known_bugs"),
+                                         stats=worker_stats.setdefault("known_bugs", {}))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        bug = known_bug(item)
+        if bug is None:
+            return
+        fingerprint, reason = bug
+        verifier = self.registry.claim(fingerprint, item.nodeid)
+        if verifier is not None:
+            pytest.xfail(f"{reason} (known bug, reproduced by {verifier})")
+
+    def pytest_runtest_logreport(self, report):
+        self.registry.record(report)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        if not is_worker():
+            self.registry.save(worker_stats.get("known_bugs", {}))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        stats = worker_stats.get("known_bugs", {})
+        if not stats.get("verified"):
+            return
+        terminalreporter.write_sep("-", "known bugs")
+        if stats.get("full_check"):
+            terminalreporter.write_line(f"full re-check: {stats['verified']} xfail cases run in full")
+            return
+        terminalreporter.write_line(
+            f"{len(stats['reproduced'])} known bugs still reproduce, {stats['deduplicated']} more cases with the "
+            f"same fingerprint were marked xfail without running")
+
+
+def pytest_configure(config):
+    if config.getoption("no_known_bugs") or config.option.runxfail:
+        return
+    config.pluginmanager.register(KnownBugsPlugin(config), PLUGIN_NAME)
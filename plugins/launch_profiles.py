@@ -0,0 +1,73 @@
+import os
+import shlex
+import time
+
+import pytest
+from utils.launch_profiles import PROFILES
+from utils.workers import is_worker
+
+PLUGIN_NAME = "easysend-launch-profiles"
+TIMINGS_KEY = "easysend/profile-timings"
+KEPT_TIMINGS = 10
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("launch-profiles", "browser launch profiles")
+    group.addoption("--browser-profile", choices=sorted(PROFILES), default=os.getenv("BROWSER_PROFILE", "fast"),
+                    help="Browser launch profile, 'fast' (default) is headless and blocks fonts, media and analytics, "
+                         "'no-images' also stubs images. Defaults to the BROWSER_PROFILE environment variable.")
+    group.addoption("--browser-arg", action="append", default=shlex.split(os.getenv("BROWSER_ARGS", "")),
+                    help="Extra Chromium command line argument, can be repeated (BROWSER_ARGS).")
+    group.addoption("--compare-profiles", action="store_true", default=False,
+                    help="Print the recorded run times of every launch profile.")
+
+
+class LaunchProfilePlugin:
+    def __init__(self, config):
+        self.config = config
+        self.profile = PROFILES[config.getoption("browser_profile")]
+        self.extra_args = config.getoption("browser_arg")
+        self.started = time.perf_counter()
+
+    def launch_options(self):
+        return self.profile.launch_options(self.extra_args)
+
+    def pytest_sessionfinish(self, session):
+        cache = getattr(self.config, "cache", None)
+        if cache is None or is_worker() or not session.testscollected or self.config.option.collectonly:
+            return
+        timings = cache.get(TIMINGS_KEY, {})
+        runs = timings.setdefault(self.profile.name, [])
+        runs.append({
+            "seconds": round(time.perf_counter() - self.started, 2),
+            "tests": session.testscollected,
+            "args": self.extra_args,
+            "at": time.time(),
+        })
+        timings[self.profile.name] = runs[-KEPT_TIMINGS:]
+        cache.set(TIMINGS_KEY, timings)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.config.getoption("compare_profiles"):
+            return
+        timings = self.config.cache.get(TIMINGS_KEY, {})
+        terminalreporter.write_sep("-", "launch profile run times")
+        terminalreporter.write_line(f"{'profile':<10} {'runs':>5} {'last run':>10} {'per test':>9} {'best/test':>10}")
+        for name in sorted(PROFILES):
+            runs = timings.get(name)
+            if not runs:
+                terminalreporter.write_line(f"{name:<10} {0:>5} {'-':>10} {'-':>9} {'-':>10}")
+                continue
+            last = runs[-1]
+            best = min(run["seconds"] / run["tests"] for run in runs)
+            terminalreporter.write_line(f"{name:<10} {len(runs):>5} {last['seconds']:>9.1f}s "
+                                        f"{last['seconds'] / last['tests']:>8.2f}s {best:>9.2f}s")
+
+
+def get_profile_plugin(config):
+    return config.pluginmanager.get_plugin(PLUGIN_NAME)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    config.pluginmanager.register(LaunchProfilePlugin(config), PLUGIN_NAME)
@@ -0,0 +1,68 @@
+import os
+from contextlib import contextmanager
+
+from utils.network import NetworkRecorder, format_bytes, summarize, url_key
+from utils.workers import is_worker, worker_stats
+
+PLUGIN_NAME = "easysend-network"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("network", "request instrumentation")
+    group.addoption("--record-network", action="store_true", default=os.getenv("RECORD_NETWORK", "0") == "1",
+                    help="Record every request of a test and attach a summary to its report (RECORD_NETWORK=1).")
+    group.addoption("--network-top", type=int, default=15, metavar="N",
+                    help="Number of URLs listed in the end-of-session network summary.")
+
+
+class NetworkPlugin:
+    def __init__(self, config):
+        self.top = config.getoption("network_top")
+        self.stats = worker_stats.setdefault("network", {})
+
+    def attach(self, item, entries):
+        item.add_report_section("teardown", "network", summarize(entries))
+        item.user_properties.append(("network_requests", len(entries)))
+        item.user_properties.append(("network_bytes", sum(entry["bytes"] for entry in entries)))
+        item.user_properties.append(("network_in_flight", sum(entry["state"] == "in flight" for entry in entries)))
+
+        for entry in entries:
+            url = self.stats.setdefault(url_key(entry["url"]), {"requests": 0, "bytes": 0, "total_ms": 0.0,
+                                                                  "max_ms": 0.0, "in_flight": 0})
+            url["requests"] += 1
+            url["bytes"] += entry["bytes"]
+            url["total_ms"] += entry["duration_ms"] or 0.0
+            url["max_ms"] = max(url["max_ms"], entry["duration_ms"] or 0.0)
+            url["in_flight"] += entry["state"] == "in flight"
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if is_worker() or not self.stats:
+            return
+        rows = sorted(self.stats.items(), key=lambda row: (row[1]["bytes"], row[1]["total_ms"]), reverse=True)
+        terminalreporter.write_sep("-", "network")
+        terminalreporter.write_line(f"{'requests':>8} {'transferred':>11} {'total':>9} {'max':>8} {'in flight':>9}  url")
+        for url, stats in rows[:self.top]:
+            terminalreporter.write_line(
+                f"{stats['requests']:>8} {format_bytes(stats['bytes']):>11} {stats['total_ms'] / 1000:>8.2f}s "
+                f"{stats['max_ms']:>6.0f}ms {stats['in_flight']:>9}  {url}")
+
+
+@contextmanager
+def record_network(request, page):
+    plugin = request.config.pluginmanager.get_plugin(PLUGIN_NAME)
+    if plugin is None:
+        yield
+        return
+
+    recorder = NetworkRecorder(page)
+    recorder.start()
+    try:
+        yield
+    finally:
+        recorder.stop()
+        plugin.attach(request.node, recorder.entries())
+
+
+def pytest_configure(config):
+    if config.getoption("record_network"):
+        config.pluginmanager.register(NetworkPlugin(config), PLUGIN_NAME)
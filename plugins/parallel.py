@@ -0,0 +1,197 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+from plugins.durations import get_store
+from utils.durations import partition
+from utils.page_reuse import partition_groups
+from utils.workers import WORKER_ENV, is_worker, merge_stats, worker_stats
+
+PLUGIN_NAME = "easysend-parallel"
+CONTROLLER_ONLY_OPTIONS = ("--workers", "--junitxml", "--junit-xml")
+POLL_INTERVAL = 0.1
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("parallel", "parallel worker mode")
+    group.addoption("--workers", default=os.getenv("WORKERS", "0"),
+                    help="Number of worker processes, each with its own browser, or 'auto' for one per CPU. "
+                         "Defaults to the WORKERS environment variable.")
+    group.addoption("--worker-tests", default=None, help="Internal: file with the node ids a worker runs.")
+    group.addoption("--worker-report", default=None, help="Internal: file a worker streams its reports to.")
+
+
+def worker_count(config):
+    value = str(config.getoption("workers")).strip().lower()
+    if value == "auto":
+        return os.cpu_count() or 1
+    return int(value or 0)
+
+
+def worker_args(config):
+    args = []
+    skip_next = False
+    for arg in config.invocation_params.args:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in CONTROLLER_ONLY_OPTIONS:
+            skip_next = True
+            continue
+        if arg.startswith(tuple(f"{option}=" for option in CONTROLLER_ONLY_OPTIONS)):
+            continue
+        args.append(arg)
+    return args
+
+
+class WorkerPlugin:
+    def __init__(self, config):
+        self.config = config
+        self.report_file = open(config.getoption("worker_report"), "a", encoding="utf-8")
+
+    def pytest_collection_modifyitems(self, config, items):
+        selected_ids = set(Path(config.getoption("worker_tests")).read_text(encoding="utf-8").splitlines())
+        selected = [item for item in items if item.nodeid in selected_ids]
+        deselected = [item for item in items if item.nodeid not in selected_ids]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    def pytest_runtest_logreport(self, report):
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        self.report_file.write(json.dumps(data) + "\n")
+        self.report_file.flush()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        self.report_file.write(json.dumps({"worker_stats": worker_stats}) + "\n")
+        self.report_file.flush()
+
+    def pytest_unconfigure(self):
+        self.report_file.close()
+
+
+class Worker:
+    def __init__(self, index, nodeids, directory, config):
+        self.name = f"gw{index}"
+        self.nodeids = nodeids
+        self.pending = set(nodeids)
+        tests_path = directory / f"{self.name}.tests"
+        tests_path.write_text("\n".join(nodeids), encoding="utf-8")
+        report_path = directory / f"{self.name}.jsonl"
+        report_path.touch()
+        self.log_path = directory / f"{self.name}.log"
+
+        self._log = open(self.log_path, "w", encoding="utf-8")
+        self._reports = open(report_path, "r", encoding="utf-8")
+        self._buffer = ""
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "pytest", *worker_args(config),
+             f"--worker-tests={tests_path}", f"--worker-report={report_path}"],
+            cwd=config.invocation_params.dir,
+            env=dict(os.environ, **{WORKER_ENV: self.name}),
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+        )
+
+    def read_reports(self):
+        self._buffer += self._reports.read()
+        *lines, self._buffer = self._buffer.split("\n")
+        return [json.loads(line) for line in lines if line]
+
+    def is_running(self):
+        return self.process.poll() is None
+
+    def terminate(self):
+        if self.is_running():
+            self.process.terminate()
+            self.process.wait()
+
+    def close(self):
+        self._reports.close()
+        self._log.close()
+
+    def log_tail(self, lines=40):
+        return "\n".join(self.log_path.read_text(encoding="utf-8", errors="replace").splitlines()[-lines:])
+
+
+class ControllerPlugin:
+    def __init__(self, config, count):
+        self.config = config
+        self.count = count
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            raise session.Interrupted(
+                f"{session.testsfailed} error{'s' if session.testsfailed != 1 else ''} during collection")
+        if session.config.option.collectonly:
+            return True
+
+        nodeids = [item.nodeid for item in session.items]
+        buckets = partition(nodeids, get_store(self.config).as_dict(), self.count, partition_groups(session.items))
+        if len(buckets) < 2:
+            return None
+
+        reporter = self.config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(f"running {len(nodeids)} tests across {len(buckets)} workers")
+
+        directory = Path(tempfile.mkdtemp(prefix="easysend-workers-"))
+        workers = [Worker(index, bucket, directory, self.config) for index, bucket in enumerate(buckets)]
+        try:
+            self._run(session, workers)
+        finally:
+            for worker in workers:
+                worker.terminate()
+                worker.close()
+
+        for worker in workers:
+            if worker.process.returncode not in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED):
+                session.testsfailed += 1
+                if reporter is not None:
+                    reporter.write_sep("-", f"worker {worker.name} exited with code {worker.process.returncode}")
+                    reporter.write_line(worker.log_tail())
+            if worker.pending and reporter is not None:
+                reporter.write_line(f"worker {worker.name} did not report {len(worker.pending)} tests: "
+                                    + ", ".join(sorted(worker.pending)))
+        return True
+
+    def _run(self, session, workers):
+        hook = self.config.hook
+        while True:
+            running = [worker for worker in workers if worker.is_running()]
+            for worker in workers:
+                for data in worker.read_reports():
+                    if "worker_stats" in data:
+                        merge_stats(worker_stats, data["worker_stats"])
+                        continue
+                    report = hook.pytest_report_from_serializable(config=self.config, data=data)
+                    if report.when == "setup":
+                        hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+                    hook.pytest_runtest_logreport(report=report)
+                    if report.when == "teardown":
+                        worker.pending.discard(report.nodeid)
+                        hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+            if session.shouldfail or session.shouldstop:
+                for worker in running:
+                    worker.terminate()
+                return
+            if not running:
+                return
+            time.sleep(POLL_INTERVAL)
+
+
+def pytest_configure(config):
+    if is_worker() and config.getoption("worker_report"):
+        config.pluginmanager.register(WorkerPlugin(config), PLUGIN_NAME)
+        return
+
+    count = worker_count(config)
+    if count > 1 and not is_worker():
+        config.pluginmanager.register(ControllerPlugin(config, count), PLUGIN_NAME)
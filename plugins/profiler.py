@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+import pytest
+from pages.aio.base_page import AsyncBasePage
+from pages.base_page import BasePage
+from utils.profiler import PageProfiler, find_regressions, summarize
+from utils.workers import is_worker, worker_stats
+
+PLUGIN_NAME = "easysend-profiler"
+SORT_KEYS = {
+    "total": "total_seconds",
+    "mean": "mean_seconds",
+    "max": "max_seconds",
+    "calls": "calls",
+    "playwright": "playwright_calls",
+    "wait": "wait_seconds",
+}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("profiler", "page object profiler")
+    group.addoption("--profile-pages", action="store_true", default=False,
+                    help="Time every public page object method and report the totals.")
+    group.addoption("--profile-report", default="page_profile.json",
+                    help="JSON file the page object profile is written to.")
+    group.addoption("--profile-sort", choices=sorted(SORT_KEYS), default="total",
+                    help="Column the terminal summary is sorted by.")
+    group.addoption("--profile-top", type=int, default=25, help="Number of methods shown in the terminal summary.")
+    group.addoption("--profile-baseline", default=None,
+                    help="Previous profile report to compare against; slower methods are flagged as regressions.")
+    group.addoption("--profile-threshold", type=float, default=0.25,
+                    help="Relative slowdown of a method's mean time that counts as a regression.")
+    group.addoption("--profile-save-baseline", action="store_true", default=False,
+                    help="Also write this run's profile to --profile-baseline.")
+    group.addoption("--profile-fail-on-regression", action="store_true", default=False,
+                    help="Exit with a non-zero status when a method is flagged as a regression.")
+
+
+class ProfilerPlugin:
+    def __init__(self, config):
+        self.config = config
+        self.profiler = PageProfiler(stats=worker_stats.setdefault("page_profile", {}))
+        self.profiler.install(BasePage, AsyncBasePage)
+        self.methods = {}
+        self.regressions = []
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        if is_worker():
+            return
+        self.methods = summarize(worker_stats.get("page_profile", {}))
+        if not self.methods:
+            return
+
+        baseline_path = self.config.getoption("profile_baseline")
+        if baseline_path and Path(baseline_path).exists():
+            baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))["methods"]
+            self.regressions = find_regressions(self.methods, baseline, self.config.getoption("profile_threshold"))
+
+        report = {"methods": self.methods, "regressions": self.regressions,
+                  "counts_playwright_calls": self.profiler.counts_calls}
+        Path(self.config.getoption("profile_report")).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        if baseline_path and self.config.getoption("profile_save_baseline"):
+            Path(baseline_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        failing = self.regressions and self.config.getoption("profile_fail_on_regression")
+        if failing and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.methods:
+            return
+        sort_key = SORT_KEYS[self.config.getoption("profile_sort")]
+        rows = sorted(self.methods.items(), key=lambda item: item[1][sort_key], reverse=True)
+        terminalreporter.write_sep("=", "page object profile")
+        terminalreporter.write_line(f"{'calls':>6} {'total':>8} {'mean':>7} {'max':>7} {'wait':>8} {'pw calls':>9}  method")
+        for key, entry in rows[:self.config.getoption("profile_top")]:
+            playwright_calls = entry["playwright_calls"] if self.profiler.counts_calls else "-"
+            terminalreporter.write_line(
+                f"{entry['calls']:>6} {entry['total_seconds']:>7.2f}s {entry['mean_seconds']:>6.2f}s "
+                f"{entry['max_seconds']:>6.2f}s {entry['wait_seconds']:>7.2f}s {playwright_calls:>9}  {key}")
+        if not self.profiler.counts_calls:
+            terminalreporter.write_line("Playwright call counts are disabled: this Playwright version has no "
+                                        "patchable connection channel.", yellow=True)
+        terminalreporter.write_line(f"full report written to {self.config.getoption('profile_report')}")
+
+        for regression in self.regressions:
+            terminalreporter.write_line(
+                f"REGRESSION {regression['method']}: mean {regression['mean_seconds']:.2f}s, "
+                f"baseline {regression['baseline_mean_seconds']:.2f}s", red=True)
+
+
+def pytest_configure(config):
+    if config.getoption("profile_pages"):
+        config.pluginmanager.register(ProfilerPlugin(config), PLUGIN_NAME)
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+from plugins.parallel import worker_count
+from utils.replay import REPLAY_MODES, clear_recordings, merge_recordings
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("replay", "record and replay of the application")
+    group.addoption("--replay", choices=REPLAY_MODES, default=os.getenv("REPLAY_MODE", "off"),
+                    help="'record' saves every response into the replay archive, 'replay' serves the suite from it "
+                         "without touching the network. Defaults to the REPLAY_MODE environment variable.")
+    group.addoption("--replay-archive", default=os.getenv("REPLAY_ARCHIVE", "test_files/replay/demo.har"),
+                    help="HAR archive used by --replay. Defaults to the REPLAY_ARCHIVE environment variable.")
+
+
+def pytest_configure(config):
+    if config.getoption("replay") == "record" and worker_count(config) > 1:
+        raise pytest.UsageError("--replay=record writes a single archive and cannot be combined with --workers.")
+    if config.getoption("replay") == "record":
+        clear_recordings(config.getoption("replay_archive"))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    if config.getoption("replay") == "record":
+        merge_recordings(config.getoption("replay_archive"))
@@ -0,0 +1,77 @@
+import os
+import time
+
+import pytest
+from playwright.sync_api import Error, sync_playwright
+from plugins.asset_cache import install_asset_cache
+from plugins.browser_server import browser_server_endpoint
+from plugins.launch_profiles import get_profile_plugin
+from utils.context_pool import ContextPool
+from utils.replay import install_replay
+from utils.selector_check import broken, validate_selectors
+from utils.workers import is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("selector-check", "selector preflight")
+    group.addoption("--validate-selectors", action="store_true", default=False,
+                    help="Check every registered locator against the app before the first test and stop the run "
+                         "when a required one matches nothing.")
+    group.addoption("--selector-timeout", type=float, default=2000,
+                    help="Milliseconds a required locator may take to appear during the preflight.")
+
+
+def connect_browser(playwright, config):
+    endpoint = browser_server_endpoint(config)
+    if endpoint is not None:
+        try:
+            return playwright.chromium.connect_over_cdp(endpoint)
+        except Error:
+            pass
+    return playwright.chromium.launch(**get_profile_plugin(config).launch_options())
+
+
+def run_preflight(config):
+    with sync_playwright() as playwright:
+        browser = connect_browser(playwright, config)
+
+        def new_context():
+            context = browser.new_context(base_url=os.getenv("BASE_URL"))
+            install_replay(context, config.getoption("replay"), config.getoption("replay_archive"))
+            install_asset_cache(context, config)
+            get_profile_plugin(config).profile.install(context)
+            return context
+
+        pool = ContextPool(new_context, 1)
+        try:
+            return validate_selectors(pool.acquire, pool.release, config.getoption("selector_timeout"))
+        finally:
+            pool.close()
+            browser.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtestloop(session):
+    config = session.config
+    if config.getoption("validate_selectors") and not is_worker() and not config.option.collectonly:
+        started = time.perf_counter()
+        results = run_preflight(config)
+        report(config, results, time.perf_counter() - started)
+    yield
+
+
+def report(config, results, seconds):
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_sep("-", f"selector preflight ({seconds:.1f}s)")
+        for result in results:
+            count = "-" if result["count"] is None else result["count"]
+            flag = "" if result["required"] else " (optional)"
+            reporter.write_line(f"{count:>4}  {result['state']:<18} {result['name']}{flag}  {result['selector']}"
+                                + (f"  {result['error']}" if result["error"] else ""),
+                                red=result in broken(results))
+
+    failures = broken(results)
+    if failures:
+        pytest.exit(f"{len(failures)} required selectors match nothing: "
+                    + ", ".join(result["name"] for result in failures), returncode=pytest.ExitCode.TESTS_FAILED)
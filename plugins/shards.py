@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+import pytest
+from utils.durations import estimate
+from utils.page_reuse import partition_groups
+from utils.shards import DEFAULT_REPORT_DIR, ShardResults, load_durations, select, shard_name
+from utils.workers import is_worker
+
+PLUGIN_NAME = "easysend-shards"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("shards", "duration-aware sharding across CI nodes")
+    group.addoption("--shard-index", type=int, default=int(os.getenv("SHARD_INDEX", "0")),
+                    help="1-based index of the shard this node runs (SHARD_INDEX).")
+    group.addoption("--shard-count", type=int, default=int(os.getenv("SHARD_COUNT", "0")),
+                    help="Total number of shards (SHARD_COUNT). Tests are split by recorded duration.")
+    group.addoption("--shard-durations", default=os.getenv("SHARD_DURATIONS"), metavar="FILE",
+                    help="JSON file of node id to seconds, e.g. the durations.json of a previous merge. "
+                         "Every shard must use the same file; without one every test counts the same.")
+    group.addoption("--shard-report-dir", default=os.getenv("SHARD_REPORT_DIR", DEFAULT_REPORT_DIR),
+                    help="Directory the shard's JSON and JUnit reports are written to.")
+
+
+class ShardPlugin:
+    def __init__(self, config, index, count):
+        self.config = config
+        self.index = index
+        self.count = count
+        self.directory = Path(config.getoption("shard_report_dir"))
+        self.results = None
+        self.summary = None
+
+    def durations(self):
+        path = self.config.getoption("shard_durations")
+        return load_durations(path) if path else {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        nodeids = [item.nodeid for item in items]
+        durations = self.durations()
+        selected_ids = set(select(nodeids, durations, self.index, self.count, partition_groups(items)))
+        estimates = {nodeid: seconds for nodeid, seconds in estimate(nodeids, durations).items()
+                     if nodeid in selected_ids}
+
+        selected = [item for item in items if item.nodeid in selected_ids]
+        deselected = [item for item in items if item.nodeid not in selected_ids]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.results = ShardResults(self.index, self.count, estimates, collected=nodeids)
+        self.summary = (f"shard {self.index}/{self.count}: {len(selected)} of {len(nodeids)} tests, "
+                        f"estimated {sum(estimates.values()):.1f}s")
+
+    def pytest_deselected(self, items):
+        if self.results is not None:
+            self.results.filtered.update(item.nodeid for item in items)
+
+    def pytest_runtest_logreport(self, report):
+        if self.results is not None:
+            self.results.add(report)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.results is None or self.config.option.collectonly:
+            return
+        self.results.write(self.directory / f"{shard_name(self.index, self.count)}.json")
+        if exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED and not self.results.estimates:
+            session.exitstatus = pytest.ExitCode.OK
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.summary is not None:
+            terminalreporter.write_sep("-", "shard")
+            terminalreporter.write_line(self.summary)
+            terminalreporter.write_line(f"reports written to {self.directory}, "
+                                        f"combine them with `python -m utils.shards merge {self.directory}`")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    index, count = config.getoption("shard_index"), config.getoption("shard_count")
+    if not count or is_worker():
+        return
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard-index must be between 1 and --shard-count ({count}), got {index}")
+
+    if not config.option.xmlpath:
+        config.option.xmlpath = str(Path(config.getoption("shard_report_dir")) / f"{shard_name(index, count)}.xml")
+    config.pluginmanager.register(ShardPlugin(config, index, count), PLUGIN_NAME)
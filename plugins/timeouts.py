@@ -0,0 +1,43 @@
+import os
+
+import pytest
+from utils.timeouts import timeouts
+from utils.workers import worker_id
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("timeouts", "adaptive timeouts")
+    group.addoption("--no-adaptive-timeouts", action="store_true",
+                    default=os.getenv("ADAPTIVE_TIMEOUTS", "1") == "0",
+                    help="Use the fixed page object timeouts; latencies are still recorded (ADAPTIVE_TIMEOUTS=0).")
+    group.addoption("--timeout-percentile", type=float, default=float(os.getenv("TIMEOUT_PERCENTILE", "99")),
+                    help="Percentile of the recorded successful latencies a learned timeout is based on.")
+    group.addoption("--timeout-margin", type=float, default=float(os.getenv("TIMEOUT_MARGIN", "1.5")),
+                    help="Factor applied to that percentile.")
+    group.addoption("--timeout-report", action="store_true", default=False,
+                    help="Print the learned timeout of every page object action.")
+
+
+def pytest_configure(config):
+    if getattr(config, "cache", None) is None:
+        return
+    timeouts.configure(config.cache.mkdir("easysend-timeouts"), worker_id(),
+                       enabled=not config.getoption("no_adaptive_timeouts"),
+                       percentile=config.getoption("timeout_percentile"),
+                       margin=config.getoption("timeout_margin"))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish():
+    timeouts.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("timeout_report") or not timeouts.defaults:
+        return
+    terminalreporter.write_sep("-", "adaptive timeouts")
+    terminalreporter.write_line(f"{'samples':>8} {'default':>8} {'learned':>8}  action")
+    for key in sorted(timeouts.defaults):
+        learned = timeouts.learned(key)
+        terminalreporter.write_line(f"{len(timeouts.samples(key)):>8} {timeouts.defaults[key]:>6}ms "
+                                    f"{'-' if learned is None else f'{learned}ms':>8}  {key}")
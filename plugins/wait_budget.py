@@ -0,0 +1,56 @@
+import pytest
+from utils.wait_budget import budget
+
+PLUGIN_NAME = "easysend-wait-budget"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("wait-budget", "wait-time budget report")
+    group.addoption("--wait-report", action="store", type=int, default=None, metavar="N",
+                    help="Show the N tests that spent the most time in explicit waits (0 shows all).")
+
+
+class WaitBudgetReporter:
+    def __init__(self, config):
+        self.limit = config.getoption("wait_report")
+        self.records = []
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self):
+        budget.reset()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, call):
+        outcome = yield
+        if call.when != "teardown":
+            return
+        report = outcome.get_result()
+        report.user_properties.append(("wait_time", round(budget.waited, 3)))
+        report.user_properties.append(("act_time", round(budget.elapsed() - budget.waited, 3)))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        properties = dict(report.user_properties)
+        if "wait_time" in properties:
+            self.records.append((report.nodeid, properties["wait_time"], properties["act_time"]))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.limit is None or not self.records:
+            return
+        records = sorted(self.records, key=lambda record: record[1], reverse=True)
+        if self.limit:
+            records = records[:self.limit]
+
+        total_wait = sum(record[1] for record in self.records)
+        total_act = sum(record[2] for record in self.records)
+        terminalreporter.write_sep("=", "wait-time budget (explicit waits)")
+        terminalreporter.write_line(f"{'wait':>8} {'act':>8} {'wait %':>7}  test")
+        for nodeid, waited, acted in records:
+            share = 100 * waited / (waited + acted) if waited + acted else 0
+            terminalreporter.write_line(f"{waited:8.2f} {acted:8.2f} {share:6.1f}%  {nodeid}")
+        terminalreporter.write_line(f"total: {total_wait:.2f}s in explicit waits, {total_act:.2f}s everything else")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(WaitBudgetReporter(config), PLUGIN_NAME)
@@ -0,0 +1,92 @@
+import ast
+from pathlib import Path
+
+from pages.locators import BookingLocators
+from utils.affected_tests import ChangeSet, parse_diff, scope_at
+
+DIFF = """diff --git a/pages/home_page.py b/pages/home_page.py
+index 1111111..2222222 100644
+--- a/pages/home_page.py
++++ b/pages/home_page.py
+@@ -10,2 +10,3 @@ class HomePage(HomeLocators, BasePage):
+@@ -40 +41,0 @@ class HomePage(HomeLocators, BasePage):
+diff --git a/pages/old_page.py b/pages/old_page.py
+deleted file mode 100644
+index 3333333..0000000
+--- a/pages/old_page.py
++++ /dev/null
+@@ -1,3 +0,0 @@
+"""
+
+SOURCE = """import re
+
+LIMIT = 3
+
+
+class Page:
+    title = "home"
+
+    def open(self):
+        return 1
+
+    @property
+    def closed(self):
+        return 2
+"""
+
+
+def test_parse_diff_maps_paths_to_changed_lines():
+    changes = parse_diff(DIFF)
+
+    assert changes == {"pages/home_page.py": {10, 11, 12, 41}, "pages/old_page.py": None}
+
+
+def test_scope_at_finds_the_innermost_definition():
+    tree = ast.parse(SOURCE)
+
+    assert scope_at(tree, "pages.page", 1) == "pages.page"
+    assert scope_at(tree, "pages.page", 3) == "pages.page"
+    assert scope_at(tree, "pages.page", 6) == "pages.page:Page"
+    assert scope_at(tree, "pages.page", 7) == "pages.page:Page.title"
+    assert scope_at(tree, "pages.page", 10) == "pages.page:Page.open"
+    assert scope_at(tree, "pages.page", 12) == "pages.page:Page.closed"
+
+
+def test_change_set_selects_tests_by_recorded_dependencies(tmp_path):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "page.py").write_text(SOURCE, encoding="utf-8")
+    changes = ChangeSet(tmp_path, {"pages/page.py": {10}, "tests/test_login.py": {5}, "README.md": {1}})
+
+    assert changes.full_suite_reason is None
+    assert changes.affects("tests/test_hero.py::test_open", ["pages.page:Page.open"])
+    assert changes.affects("tests/test_hero.py::test_page", ["pages.page:Page"])
+    assert not changes.affects("tests/test_hero.py::test_closed", ["pages.page:Page.closed"])
+    assert not changes.affects("tests/test_hero.py::test_nothing", [])
+    assert changes.affects("tests/test_hero.py::test_unrecorded", None)
+    assert changes.affects("tests/test_login.py::test_login", [])
+    assert changes.affects("tests/test_hero.py::test_watched", [], watched_paths=["pages"])
+
+
+def test_change_set_runs_full_suite_for_other_files(tmp_path):
+    changes = ChangeSet(tmp_path, {"conftest.py": {1}, "docs.md": {1}})
+
+    assert changes.full_suite_reason == "conftest.py changed"
+
+
+def test_combined_locator_depends_on_its_parts():
+    dependencies = BookingLocators.checkout_form.dependencies()
+
+    assert "pages.locators:BookingLocators.checkout_form" in dependencies
+    assert "pages.locators:BookingLocators.ssn_field" in dependencies
+    assert "pages.locators:BookingLocators.terms_checkbox" in dependencies
+
+
+def test_change_set_runs_full_suite_for_shared_page_code():
+    root = Path(__file__).resolve().parent.parent
+    locators = (root / "pages" / "locators.py").read_text(encoding="utf-8").splitlines()
+    declaration = next(number for number, line in enumerate(locators, 1) if line.strip().startswith("ssn_field ="))
+    constant = next(number for number, line in enumerate(locators, 1) if line.startswith("SPACE_CARDS_SELECTOR ="))
+
+    assert ChangeSet(root, {"pages/locators.py": {declaration}}).full_suite_reason is None
+    assert ChangeSet(root, {"pages/locators.py": {constant}}).full_suite_reason is not None
+    assert ChangeSet(root, {"pages/base_page.py": {1}}).full_suite_reason == "pages/base_page.py changed"
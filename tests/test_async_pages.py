@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from pages.aio.booking_page import AsyncBookingPage
+from pages.aio.home_page import AsyncHomePage
+from utils.async_pages import outdated_modules
+
+CONCURRENT_CHECKOUTS = 5
+
+
+@pytest.mark.depends_on("pages")
+def test_async_pages_are_generated_from_sync_pages():
+    assert outdated_modules() == [], "Async page objects are stale, run `python -m utils.async_pages`."
+
+
+@pytest.mark.sanity
+def test_concurrent_checkouts_fill_forms(async_runner, new_async_website):
+    async def checkout(index):
+        website = await new_async_website()
+        home_page = AsyncHomePage(website.page)
+        await home_page.navigate_to_destinations_section()
+        await home_page.book_first_destination()
+
+        booking_page = AsyncBookingPage(website.page)
+        assert await booking_page.is_loaded()
+        await booking_page.fill_form(
+            name=f"John Doe {index}",
+            email=f"johndoe{index}@example.com",
+            ssn="123-45-6789",
+            phone="13235993883",
+            promo_code="PROMO2023"
+        )
+        return await booking_page.name_field.input_value()
+
+    async def checkouts():
+        return await asyncio.gather(*(checkout(index) for index in range(CONCURRENT_CHECKOUTS)))
+
+    names = async_runner.run(checkouts())
+
+    assert names == [f"John Doe {index}" for index in range(CONCURRENT_CHECKOUTS)]
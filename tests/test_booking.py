@@ -23,17 +23,36 @@ def test_fill_form_and_agree_to_terms(booking_page):
     expect(booking_page.terms_checkbox).to_be_checked()
 
 
+@pytest.mark.sanity
+def test_fill_form_batched_sets_values_and_agrees_to_terms(booking_page):
+    values = booking_page.fill_form_batched(
+        name="John Doe",
+        email="johndoe@example.com",
+        ssn="123-45-6789",
+        phone="13235993883",
+        promo_code="PROMO2023",
+        agree_to_terms=True
+    )
+
+    assert values == {"name": "John Doe", "email": "johndoe@example.com", "ssn": "123-45-6789",
+                      "phone": "13235993883", "promo_code": "PROMO2023", "terms": True}
+    expect(booking_page.name_field).to_have_value("John Doe")
+    expect(booking_page.promo_code_field).to_have_value("PROMO2023")
+    expect(booking_page.terms_checkbox).to_be_checked()
+    expect(booking_page.pay_now_button).to_be_enabled()
+
+
 @pytest.mark.sanity
 @pytest.mark.parametrize("invalid_promos", ["     ", "123123", "PROMOINVALID", "RRRRR", "lowercase"])
 def test_fake_promo_code_applies_discount(booking_page, invalid_promos):
-    total_price = booking_page.get_total_price()
     booking_page.promo_code_field.fill(invalid_promos)
 
-    booking_page.click_apply_button()
-
-    updated_total_price = booking_page.get_total_price()
+    with booking_page.observe_total_price("promo_apply") as total_price:
+        booking_page.click_apply_button()
 
-    assert total_price < updated_total_price, f"Expected total price to be {total_price}, but got {updated_total_price}."
+    assert total_price.before < total_price.after, (
+        f"Expected total price to be {total_price.before}, but got {total_price.after}."
+    )
 
 
 @pytest.mark.sanity
@@ -117,14 +136,12 @@ def test_pay_now_button_no_action(booking_page):
     pytest.param(5, marks=pytest.mark.xfail(reason="Adults count of 5 is out of bounds"))
 ])
 def test_price_increases_when_adding_adults(home_page, booking_page, adults_count):
-    initial_total_price = booking_page.get_total_price()
-
-    home_page.select_adults(adults_count)
-    total_price_after_adults = booking_page.get_total_price()
+    with booking_page.observe_total_price("adults") as total_price:
+        home_page.select_adults(adults_count)
 
-    assert total_price_after_adults > initial_total_price, (
+    assert total_price.after > total_price.before, (
         f"Expected total price to increase after adding adults, but it did not. "
-        f"Initial: {initial_total_price}, After adding adults: {total_price_after_adults}"
+        f"Initial: {total_price.before}, After adding adults: {total_price.after}"
     )
 
 
@@ -135,14 +152,12 @@ def test_price_increases_when_adding_adults(home_page, booking_page, adults_coun
     pytest.param(5, marks=pytest.mark.xfail(reason="Adults count of 5 is out of bounds"))
 ])
 def test_price_increases_when_adding_children(home_page, booking_page, children_count):
-    initial_total_price = booking_page.get_total_price()
-
-    home_page.select_children(children_count)
-    total_price_after_children = booking_page.get_total_price()
+    with booking_page.observe_total_price("children") as total_price:
+        home_page.select_children(children_count)
 
-    assert total_price_after_children > initial_total_price, (
+    assert total_price.after > total_price.before, (
         f"Expected total price to increase after adding children, but it did not. "
-        f"Initial: {initial_total_price}, After adding children: {total_price_after_children}"
+        f"Initial: {total_price.before}, After adding children: {total_price.after}"
     )
 
 
@@ -0,0 +1,43 @@
+from utils.load_runner import LoadResults, arrival_offsets, percentile, summarize
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [5, 1, 4, 2, 3, 6, 7, 8, 9, 10]
+
+    assert percentile(samples, 50) == 5
+    assert percentile(samples, 90) == 9
+    assert percentile(samples, 99) == 10
+    assert percentile([3], 50) == 3
+    assert percentile([], 50) is None
+
+
+def test_constant_arrivals_are_evenly_spaced():
+    assert list(arrival_offsets(4, 2.0, "constant")) == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_poisson_arrivals_are_reproducible_with_a_seed():
+    offsets = list(arrival_offsets(50, 5.0, "poisson", seed=7))
+
+    assert offsets == list(arrival_offsets(50, 5.0, "poisson", seed=7))
+    assert offsets[0] == 0.0
+    assert offsets == sorted(offsets)
+    assert 4 < offsets[-1] < 20
+
+
+def test_summarize_reports_every_step_and_run_totals():
+    results = LoadResults()
+    results.samples["open"] = [0.2, 0.4, 0.6]
+    results.errors["book"] = 2
+    results.started, results.completed, results.failed, results.duration = 4, 2, 2, 2.0
+
+    summary = summarize(results)
+    steps = {row["step"]: row for row in summary["steps"]}
+
+    assert (summary["users"], summary["completed"], summary["failed"]) == (4, 2, 2)
+    assert summary["arrival_rate"] == 2.0
+    assert summary["throughput"] == 1.0
+    assert steps["open"]["count"] == 3
+    assert abs(steps["open"]["mean"] - 0.4) < 1e-9
+    assert (steps["open"]["p50"], steps["open"]["max"]) == (0.4, 0.6)
+    assert steps["book"] == {"step": "book", "count": 0, "errors": 2, "mean": None, "p50": None, "p90": None,
+                             "p95": None, "p99": None, "max": None}
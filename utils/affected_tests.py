@@ -0,0 +1,191 @@
+import ast
+import functools
+import inspect
+import re
+import subprocess
+from pathlib import Path
+
+from pages.locators import LOCATOR_GROUPS, locator_specs
+from utils.profiler import all_subclasses
+
+INDEX_KEY = "easysend/dependencies"
+HUNK_PATTERN = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+IGNORED_NAMES = {".gitignore", "LICENSE"}
+IGNORED_SUFFIXES = (".md",)
+LOCATORS_MODULE = "pages/locators.py"
+SHARED_PAGE_MODULES = {"pages/base_page.py", "pages/aio/base_page.py"}
+
+
+class DependencyRecorder:
+    def __init__(self, stats=None):
+        self.stats = stats if stats is not None else {}
+        self.current = None
+
+    def install(self, *base_classes):
+        for base_class in base_classes:
+            for cls in (base_class, *all_subclasses(base_class)):
+                self.instrument(cls)
+
+    def instrument(self, cls):
+        for name, value in list(vars(cls).items()):
+            if not inspect.isfunction(value) or getattr(value, "__dependency_tracked__", False):
+                continue
+            setattr(cls, name, self._wrap(f"{value.__module__}:{value.__qualname__}", value))
+
+    def start(self, nodeid):
+        self.current = nodeid
+        self.stats.setdefault(nodeid, {})
+
+    def stop(self):
+        self.current = None
+
+    def discard(self, nodeid):
+        self.stats.pop(nodeid, None)
+
+    def record(self, key):
+        if self.current is not None:
+            dependencies = self.stats.setdefault(self.current, {})
+            dependencies[key] = dependencies.get(key, 0) + 1
+
+    def _wrap(self, key, function):
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def tracked(*args, **kwargs):
+                self.record(key)
+                return await function(*args, **kwargs)
+        else:
+            @functools.wraps(function)
+            def tracked(*args, **kwargs):
+                self.record(key)
+                return function(*args, **kwargs)
+
+        tracked.__dependency_tracked__ = True
+        return tracked
+
+
+def git(root, *args):
+    return subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=True).stdout
+
+
+def git_changes(root, ref):
+    toplevel = Path(git(root, "rev-parse", "--show-toplevel").strip())
+    base = git(root, "merge-base", ref, "HEAD").strip()
+    changes = parse_diff(git(root, "diff", "--no-renames", "--unified=0", "--no-color", base, "--"))
+    for path in git(root, "ls-files", "--others", "--exclude-standard", "--full-name").splitlines():
+        changes.setdefault(path, None)
+
+    relative = {}
+    for path, lines in changes.items():
+        try:
+            relative[(toplevel / path).resolve().relative_to(Path(root).resolve()).as_posix()] = lines
+        except ValueError:
+            continue
+    return relative
+
+
+def parse_diff(diff):
+    changes = {}
+    path = None
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            path = line.split(" b/", 1)[1]
+            changes[path] = set()
+        elif line.startswith("deleted file mode") and path is not None:
+            changes[path] = None
+        else:
+            match = HUNK_PATTERN.match(line)
+            if match and path is not None and changes[path] is not None:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                changes[path].update(range(start, start + count) if count else {max(start, 1)})
+    return changes
+
+
+def changed_scopes(root, path, lines):
+    module = path[:-len(".py")].replace("/", ".")
+    source = Path(root) / path
+    if lines is None or not source.exists():
+        return {module}
+    try:
+        tree = ast.parse(source.read_text(encoding="utf-8"))
+    except SyntaxError:
+        return {module}
+    return {scope_at(tree, module, line) for line in lines}
+
+
+def scope_at(tree, module, line):
+    names = []
+    body = tree.body
+    while True:
+        for node in body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                first_line = min([node.lineno, *(decorator.lineno for decorator in node.decorator_list)])
+                if first_line <= line <= node.end_lineno:
+                    names.append(node.name)
+                    body = node.body
+                    break
+            elif (names and isinstance(node, ast.Assign) and len(node.targets) == 1
+                  and isinstance(node.targets[0], ast.Name) and node.lineno <= line <= node.end_lineno):
+                names.append(node.targets[0].id)
+                body = []
+                break
+        else:
+            break
+    return f"{module}:{'.'.join(names)}" if names else module
+
+
+def affects(scope, dependency):
+    if ":" not in scope:
+        return dependency.split(":", 1)[0] == scope
+    return dependency == scope or dependency.startswith(f"{scope}.") or scope.startswith(f"{dependency}.")
+
+
+def is_test_module(path):
+    return path.startswith("tests/") and Path(path).name.startswith("test_") and path.endswith(".py")
+
+
+def is_page_module(path):
+    return path.startswith("pages/") and path.endswith(".py")
+
+
+def is_locator_declaration(scope):
+    _, _, name = scope.partition(":")
+    parts = name.split(".")
+    return len(parts) == 2 and any(group.__name__ == parts[0] and parts[1] in locator_specs(group)
+                                   for group in LOCATOR_GROUPS)
+
+
+def is_ignored(path):
+    return Path(path).name in IGNORED_NAMES or path.endswith(IGNORED_SUFFIXES)
+
+
+class ChangeSet:
+    def __init__(self, root, changes):
+        self.paths = set(changes)
+        self.test_modules = set()
+        self.scopes = set()
+        self.full_suite_reason = None
+        for path, lines in sorted(changes.items()):
+            if is_ignored(path):
+                continue
+            if is_test_module(path):
+                self.test_modules.add(path)
+                continue
+            scopes = changed_scopes(root, path, lines) if is_page_module(path) else set()
+            if path == LOCATORS_MODULE and not all(is_locator_declaration(scope) for scope in scopes):
+                reason = f"{path} changed outside a locator declaration"
+            elif path in SHARED_PAGE_MODULES or not is_page_module(path):
+                reason = f"{path} changed"
+            else:
+                self.scopes.update(scopes)
+                continue
+            if self.full_suite_reason is None:
+                self.full_suite_reason = reason
+
+    def touches(self, prefixes):
+        return any(path == prefix or path.startswith(f"{prefix.rstrip('/')}/") for path in self.paths
+                   for prefix in prefixes)
+
+    def affects(self, nodeid, dependencies, watched_paths=()):
+        if dependencies is None or nodeid.split("::", 1)[0] in self.test_modules or self.touches(watched_paths):
+            return True
+        return any(affects(scope, dependency) for scope in self.scopes for dependency in dependencies)
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Error
+from utils.network import SERVED_BY_HEADER
+
+STATIC_ASSET_PATTERN = re.compile(r"\.(?:js|css|png|jpe?g|gif|svg|webp|ico|woff2?|ttf|eot|otf)(?:[?#].*)?$",
+                                  re.IGNORECASE)
+HASHED_PATH_PATTERN = re.compile(r"[./_-][0-9a-f]{8,}[./_-]", re.IGNORECASE)
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def cache_lifetime(url, headers):
+    directives = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+    if HASHED_PATH_PATTERN.search(urlsplit(url).path):
+        return math.inf
+    try:
+        return max(int(directives.get("max-age", "0")), 0)
+    except ValueError:
+        return 0
+
+
+class AssetCache:
+    def __init__(self, directory, max_bytes, stats=None):
+        self.directory = Path(directory)
+        self.blobs = self.directory / "blobs"
+        self.index = self.directory / "index"
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.index.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = stats if stats is not None else {}
+        for counter in ("hits", "misses", "stored", "evicted", "bytes_served"):
+            self.stats.setdefault(counter, 0)
+        self._size = sum(blob.stat().st_size for blob in self.blobs.iterdir())
+
+    def install(self, context):
+        context.route(STATIC_ASSET_PATTERN, self.handle)
+
+    async def install_async(self, context):
+        await context.route(STATIC_ASSET_PATTERN, self.handle_async)
+
+    def handle(self, route):
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+
+        cached = self.hit(request.url)
+        if cached is not None:
+            meta, body = cached
+            route.fulfill(status=meta["status"], headers={**meta["headers"], SERVED_BY_HEADER: "asset-cache"},
+                          body=body)
+            return
+
+        self.stats["misses"] += 1
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Error:
+            route.fallback()
+            return
+        if response.ok:
+            self.store(request.url, response.status, response.headers, body)
+        route.fulfill(response=response, body=body)
+
+    async def handle_async(self, route):
+        request = route.request
+        if request.method != "GET":
+            await route.fallback()
+            return
+
+        cached = self.hit(request.url)
+        if cached is not None:
+            meta, body = cached
+            await route.fulfill(status=meta["status"],
+                                headers={**meta["headers"], SERVED_BY_HEADER: "asset-cache"}, body=body)
+            return
+
+        self.stats["misses"] += 1
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Error:
+            await route.fallback()
+            return
+        if response.ok:
+            self.store(request.url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    def hit(self, url):
+        cached = self.lookup(url)
+        if cached is not None:
+            self.stats["hits"] += 1
+            self.stats["bytes_served"] += len(cached[1])
+        return cached
+
+    def _index_path(self, url):
+        return self.index / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def lookup(self, url):
+        try:
+            meta = json.loads(self._index_path(url).read_text(encoding="utf-8"))
+            expires_at = meta.get("expires_at", 0)
+            if expires_at is not None and time.time() >= expires_at:
+                return None
+            blob = self.blobs / meta["digest"]
+            body = blob.read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        os.utime(blob)
+        return meta, body
+
+    def store(self, url, status, headers, body):
+        lifetime = cache_lifetime(url, headers)
+        if not lifetime:
+            return
+        digest = hashlib.sha256(body).hexdigest()
+        blob = self.blobs / digest
+        if not blob.exists():
+            self._write(blob, body)
+            self._size += len(body)
+            self.stats["stored"] += 1
+
+        headers = {name: value for name, value in headers.items() if name.lower() not in DROPPED_HEADERS}
+        expires_at = None if lifetime == math.inf else time.time() + lifetime
+        meta = {"url": url, "digest": digest, "status": status, "headers": headers, "expires_at": expires_at}
+        self._write(self._index_path(url), json.dumps(meta).encode())
+
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        blobs = []
+        for blob in self.blobs.iterdir():
+            try:
+                stat = blob.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, blob))
+
+        self._size = sum(size for _, size, _ in blobs)
+        for _, size, blob in sorted(blobs):
+            if self._size <= self.max_bytes:
+                break
+            blob.unlink(missing_ok=True)
+            self._size -= size
+            self.stats["evicted"] += 1
+
+    def _write(self, path, data):
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
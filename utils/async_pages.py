@@ -0,0 +1,200 @@
+"""Generates the asyncio page objects in pages/aio/ from the sync ones in pages/.
+
+Run `python -m utils.async_pages` after changing a sync page object, or with `--check` to verify the
+generated modules are current.
+"""
+import ast
+import sys
+from pathlib import Path
+
+PAGES_DIR = Path(__file__).resolve().parent.parent / "pages"
+ASYNC_PAGES_DIR = PAGES_DIR / "aio"
+MODULES = ("base_page", "home_page", "booking_page", "login_page", "website")
+HEADER = "# Generated from pages/{module}.py by `python -m utils.async_pages`. Do not edit.\n"
+AWAITED_METHODS = frozenset({
+    "add_cookies", "add_init_script", "all", "all_inner_texts", "all_text_contents", "bounding_box", "check",
+    "clear", "clear_cookies", "click", "close", "content", "count", "dblclick", "dispatch_event", "down",
+    "evaluate", "evaluate_all", "evaluate_handle", "expose_function", "fill", "focus", "get_attribute", "go_back",
+    "go_forward", "goto", "hover", "inner_html", "inner_text", "input_value", "insert_text", "is_checked",
+    "is_disabled", "is_editable", "is_enabled", "is_hidden", "is_visible", "move", "new_context", "new_page",
+    "press", "reload", "route", "route_from_har", "screenshot", "scroll_into_view_if_needed", "select_option",
+    "set_checked", "set_content", "set_input_files", "storage_state", "tap", "text_content", "type", "uncheck",
+    "unroute", "up", "wait_for", "wait_for_function", "wait_for_load_state", "wait_for_selector",
+    "wait_for_timeout", "wait_for_url",
+})
+
+
+def async_class_name(name):
+    return f"Async{name}"
+
+
+def parse_modules():
+    return {module: ast.parse((PAGES_DIR / f"{module}.py").read_text(encoding="utf-8")) for module in MODULES}
+
+
+def page_classes(trees):
+    return {node.name for tree in trees.values() for node in tree.body if isinstance(node, ast.ClassDef)}
+
+
+def page_methods(trees):
+    return [method for tree in trees.values() for node in tree.body if isinstance(node, ast.ClassDef)
+            for method in node.body if isinstance(method, ast.FunctionDef)]
+
+
+def is_context_manager(method):
+    return any(is_context_manager_name(decorator) for decorator in method.decorator_list)
+
+
+def is_expect_call(node):
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "expect"
+
+
+def needs_await(node, awaited_names):
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+        return False
+    return node.func.attr in awaited_names or is_expect_call(node.func.value)
+
+
+def find_async_methods(trees):
+    methods = page_methods(trees)
+    async_names = set()
+    changed = True
+    while changed:
+        changed = False
+        for method in methods:
+            if method.name in async_names or method.name == "__init__":
+                continue
+            if any(needs_await(node, AWAITED_METHODS | async_names) for node in ast.walk(method)):
+                async_names.add(method.name)
+                changed = True
+
+    sync_names = {method.name for method in methods if method.name not in async_names}
+    ambiguous = async_names & sync_names
+    if ambiguous:
+        raise ValueError(f"Methods are async in one page object and sync in another: {sorted(ambiguous)}")
+    return async_names
+
+
+class AsyncTransformer(ast.NodeTransformer):
+    def __init__(self, module, class_names, async_names, context_names=frozenset()):
+        self.module = module
+        self.class_names = class_names
+        self.async_names = async_names
+        self.context_names = context_names
+        self.awaited_names = AWAITED_METHODS | (async_names - context_names)
+
+    def visit_Module(self, node):
+        constants = [statement for statement in node.body if is_constant(statement)]
+        body = [self.visit(statement) for statement in node.body if not is_constant(statement)]
+        if constants:
+            names = [alias(target.id) for statement in constants for target in statement.targets]
+            imports = [index for index, statement in enumerate(body) if isinstance(statement, ast.ImportFrom)]
+            position = imports[-1] + 1 if imports else 0
+            body.insert(position, ast.ImportFrom(module=f"pages.{self.module}", names=names, level=0))
+        node.body = body
+        drop_unused_context_manager(node)
+        return node
+
+    def visit_ImportFrom(self, node):
+        if node.module == "playwright.sync_api":
+            node.module = "playwright.async_api"
+        elif node.module == "contextlib" and any(name.name == "contextmanager" for name in node.names):
+            node.names = [*node.names, alias("asynccontextmanager")]
+        elif node.module in {f"pages.{module}" for module in MODULES}:
+            node.module = f"pages.aio.{node.module.split('.', 1)[1]}"
+            node.names = [alias(self.rename(name.name)) for name in node.names]
+        return node
+
+    def visit_Name(self, node):
+        node.id = self.rename(node.id)
+        return node
+
+    def visit_ClassDef(self, node):
+        node.name = self.rename(node.name)
+        self.generic_visit(node)
+        return node
+
+    def visit_FunctionDef(self, node):
+        self.generic_visit(node)
+        if node.name not in self.async_names:
+            return node
+        if node.name in self.context_names:
+            node.decorator_list = [ast.Name(id="asynccontextmanager", ctx=ast.Load())
+                                   if is_context_manager_name(decorator) else decorator
+                                   for decorator in node.decorator_list]
+        return ast.copy_location(ast.AsyncFunctionDef(**{field: getattr(node, field) for field in node._fields}), node)
+
+    def visit_With(self, node):
+        self.generic_visit(node)
+        if not any(is_method_call(item.context_expr, self.context_names) for item in node.items):
+            return node
+        return ast.copy_location(ast.AsyncWith(items=node.items, body=node.body, type_comment=node.type_comment), node)
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if needs_await(node, self.awaited_names):
+            return ast.copy_location(ast.Await(value=node), node)
+        return node
+
+    def rename(self, name):
+        return async_class_name(name) if name in self.class_names else name
+
+
+def is_context_manager_name(node):
+    return isinstance(node, ast.Name) and node.id == "contextmanager"
+
+
+def drop_unused_context_manager(module):
+    if any(isinstance(node, ast.Name) and node.id == "contextmanager" for node in ast.walk(module)):
+        return
+    for statement in module.body:
+        if isinstance(statement, ast.ImportFrom) and statement.module == "contextlib":
+            statement.names = [name for name in statement.names if name.name != "contextmanager"]
+
+
+def is_method_call(node, names):
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in names
+
+
+def is_constant(statement):
+    return (isinstance(statement, ast.Assign)
+            and all(isinstance(target, ast.Name) and target.id.isupper() for target in statement.targets))
+
+
+def alias(name):
+    return ast.alias(name=name)
+
+
+def generate():
+    trees = parse_modules()
+    class_names = page_classes(trees)
+    async_names = find_async_methods(trees)
+    context_names = {method.name for method in page_methods(trees) if is_context_manager(method)} & async_names
+    generated = {}
+    for module, tree in trees.items():
+        tree = ast.fix_missing_locations(AsyncTransformer(module, class_names, async_names, context_names).visit(tree))
+        generated[ASYNC_PAGES_DIR / f"{module}.py"] = HEADER.format(module=module) + ast.unparse(tree) + "\n"
+    return generated
+
+
+def outdated_modules():
+    return [path for path, source in generate().items()
+            if not path.exists() or path.read_text(encoding="utf-8") != source]
+
+
+def main(argv):
+    if "--check" in argv:
+        outdated = outdated_modules()
+        for path in outdated:
+            print(f"{path} is out of date, run `python -m utils.async_pages`.")
+        return 1 if outdated else 0
+
+    ASYNC_PAGES_DIR.mkdir(exist_ok=True)
+    for path, source in generate().items():
+        path.write_text(source, encoding="utf-8")
+        print(f"generated {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
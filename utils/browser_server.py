@@ -0,0 +1,161 @@
+import argparse
+import json
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from utils.launch_profiles import PROFILES
+
+DEFAULT_PORT = 9222
+DEFAULT_STATE_FILE = ".browser_server.json"
+HEALTH_TIMEOUT = 0.5
+STARTUP_TIMEOUT = 15.0
+MAX_FAILED_CHECKS = 3
+
+
+def endpoint_url(port):
+    return f"http://127.0.0.1:{port}"
+
+
+def is_healthy(endpoint, timeout=HEALTH_TIMEOUT):
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout) as response:
+            return "webSocketDebuggerUrl" in json.load(response)
+    except (OSError, ValueError):
+        return False
+
+
+def read_state(path):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def running_endpoint(path, launch_options):
+    state = read_state(path)
+    if state is None or state.get("launch_options") != launch_options:
+        return None
+    return state["endpoint"] if is_healthy(state["endpoint"]) else None
+
+
+class BrowserServer:
+    def __init__(self, executable, launch_options, port, state_file):
+        self.executable = executable
+        self.launch_options = launch_options
+        self.port = port
+        self.state_file = Path(state_file)
+        self.endpoint = endpoint_url(port)
+        self.process = None
+        self.user_data_dir = None
+        self.restarts = 0
+
+    def command(self):
+        command = [self.executable, f"--remote-debugging-port={self.port}", "--remote-debugging-address=127.0.0.1",
+                   f"--user-data-dir={self.user_data_dir}", "--no-first-run", "--no-default-browser-check"]
+        if self.launch_options["headless"]:
+            command.append("--headless=new")
+        return [*command, *self.launch_options["args"], "about:blank"]
+
+    def start(self):
+        self.user_data_dir = tempfile.mkdtemp(prefix="easysend-browser-")
+        self.process = subprocess.Popen(self.command(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            if is_healthy(self.endpoint):
+                self._write_state()
+                return True
+            time.sleep(0.1)
+        self.stop()
+        return False
+
+    def stop(self):
+        self.state_file.unlink(missing_ok=True)
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+        if self.user_data_dir is not None:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+            self.user_data_dir = None
+
+    def restart(self):
+        self.restarts += 1
+        self.stop()
+        return self.start()
+
+    def supervise(self, interval):
+        failed_checks = 0
+        while True:
+            time.sleep(interval)
+            if self.process is not None and self.process.poll() is None and is_healthy(self.endpoint):
+                failed_checks = 0
+                continue
+            failed_checks += 1
+            exited = self.process is None or self.process.poll() is not None
+            if exited or failed_checks >= MAX_FAILED_CHECKS:
+                print(f"browser unhealthy, restarting (restart {self.restarts + 1})", flush=True)
+                failed_checks = 0
+                if not self.restart():
+                    time.sleep(min(30.0, interval * 2 ** min(self.restarts, 5)))
+
+    def _write_state(self):
+        state = {"endpoint": self.endpoint, "pid": self.process.pid, "server_pid": os.getpid(),
+                 "launch_options": self.launch_options, "started_at": time.time()}
+        temp_path = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(temp_path, self.state_file)
+
+
+def chromium_executable():
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        return playwright.chromium.executable_path
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m utils.browser_server",
+                                     description="Keep a Chromium running that test sessions connect to.")
+    parser.add_argument("--browser-profile", choices=sorted(PROFILES), default=os.getenv("BROWSER_PROFILE", "fast"))
+    parser.add_argument("--browser-arg", action="append", default=shlex.split(os.getenv("BROWSER_ARGS", "")))
+    parser.add_argument("--port", type=int, default=int(os.getenv("BROWSER_SERVER_PORT", DEFAULT_PORT)))
+    parser.add_argument("--state-file", default=os.getenv("BROWSER_SERVER_STATE", DEFAULT_STATE_FILE),
+                        help="File the endpoint is published in, read by the browser fixture.")
+    parser.add_argument("--health-interval", type=float, default=2.0, help="Seconds between health checks.")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    options = parse_args(argv)
+    launch_options = PROFILES[options.browser_profile].launch_options(options.browser_arg)
+    server = BrowserServer(chromium_executable(), launch_options, options.port, options.state_file)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        if not server.start():
+            print(f"could not start Chromium on port {options.port}", file=sys.stderr)
+            return 1
+        print(f"browser server '{options.browser_profile}' listening on {server.endpoint}", flush=True)
+        server.supervise(options.health_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,79 @@
+import time
+from collections import deque
+
+from playwright.sync_api import Error
+
+CLEAR_STORAGE_SCRIPT = """() => {
+    try {
+        localStorage.clear();
+        sessionStorage.clear();
+    } catch (error) {}
+}"""
+
+
+class ContextPool:
+    def __init__(self, new_context, size, stats=None):
+        self._new_context = new_context
+        self.size = max(1, size)
+        self._idle = deque()
+        self.stats = stats if stats is not None else {}
+        for counter in ("acquired", "created", "recycled", "discarded", "wait_seconds", "max_wait_seconds"):
+            self.stats.setdefault(counter, 0)
+
+    def warm(self):
+        while len(self._idle) < self.size:
+            self._idle.append(self._create())
+
+    def _create(self):
+        context = self._new_context()
+        page = context.new_page()
+        page.goto("/", wait_until="commit")
+        self.stats["created"] += 1
+        return context, page
+
+    def acquire(self):
+        start = time.perf_counter()
+        while True:
+            context, page = self._idle.popleft() if self._idle else self._create()
+            try:
+                page.wait_for_load_state("load")
+                break
+            except Error:
+                self._discard(context)
+
+        waited = time.perf_counter() - start
+        self.stats["acquired"] += 1
+        self.stats["wait_seconds"] += waited
+        self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], waited)
+        return context, page
+
+    def release(self, context, page):
+        try:
+            for other_page in context.pages:
+                if other_page is not page:
+                    other_page.close()
+            context.clear_cookies()
+            page.evaluate(CLEAR_STORAGE_SCRIPT)
+            page.goto("about:blank")
+            page.goto("/", wait_until="commit")
+        except Error:
+            self._discard(context)
+            return
+
+        self.stats["recycled"] += 1
+        if len(self._idle) < self.size:
+            self._idle.append((context, page))
+        else:
+            context.close()
+
+    def _discard(self, context):
+        self.stats["discarded"] += 1
+        try:
+            context.close()
+        except Error:
+            pass
+
+    def close(self):
+        while self._idle:
+            context, _ = self._idle.popleft()
+            context.close()
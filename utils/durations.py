@@ -0,0 +1,60 @@
+import heapq
+import statistics
+
+DURATIONS_KEY = "easysend/durations"
+DEFAULT_DURATION = 1.0
+
+
+class DurationStore:
+    def __init__(self, cache):
+        self._cache = cache
+        self._durations = dict(cache.get(DURATIONS_KEY, {})) if cache is not None else {}
+        self._pending = {}
+
+    def get(self, nodeid, default=None):
+        return self._durations.get(nodeid, default)
+
+    def as_dict(self):
+        return dict(self._durations)
+
+    def add(self, nodeid, seconds):
+        self._pending[nodeid] = self._pending.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        if not self._pending or self._cache is None:
+            return
+        self._durations.update(self._pending)
+        self._pending = {}
+        self._cache.set(DURATIONS_KEY, self._durations)
+
+
+def estimate(nodeids, durations):
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {nodeid: durations.get(nodeid, fallback) for nodeid in nodeids}
+
+
+def partition(nodeids, durations, count, groups=None):
+    """Split nodeids into `count` buckets of roughly equal total duration.
+
+    Longest tests are placed first, each into the currently lightest bucket.
+    Node ids mapped to the same key in `groups` are kept in one bucket.
+    Every bucket keeps the original collection order.
+    """
+    groups = groups or {}
+    estimates = estimate(nodeids, durations)
+    order = {nodeid: index for index, nodeid in enumerate(nodeids)}
+    units = {}
+    for nodeid in nodeids:
+        units.setdefault(groups.get(nodeid, nodeid), []).append(nodeid)
+    weights = {key: sum(estimates[nodeid] for nodeid in unit) for key, unit in units.items()}
+
+    count = max(1, min(count, len(units)))
+    heap = [(0.0, index) for index in range(count)]
+    buckets = [[] for _ in range(count)]
+    for key in sorted(units, key=lambda k: (-weights[k], order[units[k][0]])):
+        load, index = heapq.heappop(heap)
+        buckets[index].extend(units[key])
+        heapq.heappush(heap, (load + weights[key], index))
+
+    return [sorted(bucket, key=order.__getitem__) for bucket in buckets]
@@ -0,0 +1,56 @@
+import time
+
+REGISTRY_KEY = "easysend/known-bugs"
+
+
+def known_bug(item):
+    for marker in item.iter_markers("xfail"):
+        reason = marker.kwargs.get("reason")
+        if marker.args or "condition" in marker.kwargs or not reason or not marker.kwargs.get("run", True):
+            return None
+        return f"{item.nodeid.split('[', 1)[0]}: {reason}", reason
+    return None
+
+
+class KnownBugRegistry:
+    def __init__(self, cache, recheck_seconds, force_recheck=False, stats=None):
+        self.cache = cache
+        self.registry = cache.get(REGISTRY_KEY, {}) if cache is not None else {}
+        self.full_check = force_recheck or time.time() - self.registry.get("last_full_check", 0) >= recheck_seconds
+        self.stats = stats if stats is not None else {}
+        for counter in ("verified", "deduplicated", "full_check"):
+            self.stats.setdefault(counter, 0)
+        self.stats.setdefault("reproduced", {})
+        self.stats["full_check"] = int(self.full_check)
+        self._verifiers = {}
+        self._reproduced = {}
+        self._pending = {}
+
+    def claim(self, fingerprint, nodeid):
+        if not self.full_check and fingerprint in self._reproduced:
+            self.stats["deduplicated"] += 1
+            return self._reproduced[fingerprint]
+        if self.full_check or fingerprint not in self._verifiers:
+            self._verifiers.setdefault(fingerprint, nodeid)
+            self._pending[nodeid] = fingerprint
+        return None
+
+    def record(self, report):
+        fingerprint = self._pending.get(report.nodeid)
+        if fingerprint is None:
+            return
+        reproduced = report.when == "call" and report.skipped and hasattr(report, "wasxfail")
+        if report.when == "call" or report.failed:
+            del self._pending[report.nodeid]
+            self.stats["verified"] += 1
+        if reproduced:
+            self._reproduced[fingerprint] = report.nodeid
+            self.stats["reproduced"][fingerprint] = self.stats["reproduced"].get(fingerprint, 0) + 1
+
+    def save(self, stats):
+        if self.cache is None:
+            return
+        self.registry.pop("bugs", None)
+        if stats.get("full_check"):
+            self.registry["last_full_check"] = time.time()
+        self.cache.set(REGISTRY_KEY, self.registry)
@@ -0,0 +1,74 @@
+import base64
+import re
+
+from utils.network import SERVED_BY_HEADER
+
+ANALYTICS_PATTERN = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|hotjar\.com|segment\.(?:io|com)"
+    r"|mixpanel\.com|fullstory\.com|facebook\.net|newrelic\.com|nr-data\.net"
+)
+TRANSPARENT_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+FAST_ARGS = (
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--mute-audio",
+    "--no-first-run",
+)
+
+
+class LaunchProfile:
+    def __init__(self, name, headless, args=(), blocked_types=(), stubbed_images=False, block_analytics=False):
+        self.name = name
+        self.headless = headless
+        self.args = tuple(args)
+        self.blocked_types = frozenset(blocked_types)
+        self.stubbed_images = stubbed_images
+        self.block_analytics = block_analytics
+
+    @property
+    def blocks_resources(self):
+        return bool(self.blocked_types or self.stubbed_images or self.block_analytics)
+
+    def launch_options(self, extra_args=()):
+        return {"headless": self.headless, "args": [*self.args, *extra_args]}
+
+    def install(self, context):
+        if self.blocks_resources:
+            context.route("**/*", self.handle)
+
+    async def install_async(self, context):
+        if self.blocks_resources:
+            await context.route("**/*", self.handle_async)
+
+    def handle(self, route):
+        self._respond(route)
+
+    async def handle_async(self, route):
+        await self._respond(route)
+
+    def _respond(self, route):
+        request = route.request
+        if request.resource_type in self.blocked_types:
+            return route.abort()
+        if self.block_analytics and ANALYTICS_PATTERN.search(request.url):
+            return route.abort()
+        if self.stubbed_images and request.resource_type == "image":
+            return route.fulfill(status=200, content_type="image/png", headers={SERVED_BY_HEADER: "stub"},
+                                 body=TRANSPARENT_PNG)
+        return route.fallback()
+
+
+PROFILES = {
+    "headed": LaunchProfile("headed", headless=False),
+    "headless": LaunchProfile("headless", headless=True),
+    "fast": LaunchProfile("fast", headless=True, args=FAST_ARGS, blocked_types=("font", "media"),
+                          block_analytics=True),
+    "no-images": LaunchProfile("no-images", headless=True, args=FAST_ARGS, blocked_types=("font", "media"),
+                               stubbed_images=True, block_analytics=True),
+}
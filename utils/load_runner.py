@@ -0,0 +1,221 @@
+import argparse
+import asyncio
+import csv
+import json
+import math
+import os
+import random
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from dotenv import load_dotenv
+from playwright.async_api import async_playwright
+from pages.aio.booking_page import AsyncBookingPage
+from pages.aio.home_page import AsyncHomePage
+from utils.launch_profiles import PROFILES
+from utils.replay import install_replay_async
+
+STEPS = ("wait_for_slot", "open", "destinations", "book", "fill_form", "agree_to_terms", "apply_promo", "pay_now",
+         "confirmation")
+PERCENTILES = (50, 90, 95, 99)
+ARRIVALS = ("constant", "poisson")
+
+
+class LoadResults:
+    def __init__(self):
+        self.samples = {step: [] for step in STEPS}
+        self.errors = {step: 0 for step in STEPS}
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+        self.duration = 0.0
+
+    @asynccontextmanager
+    async def step(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[name] += 1
+            raise
+        self.samples[name].append(time.perf_counter() - started)
+
+
+def percentile(samples, percent):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def summarize(results):
+    steps = []
+    for name in STEPS:
+        samples = results.samples[name]
+        row = {"step": name, "count": len(samples), "errors": results.errors[name],
+               "mean": sum(samples) / len(samples) if samples else None}
+        for percent in PERCENTILES:
+            row[f"p{percent}"] = percentile(samples, percent)
+        row["max"] = max(samples) if samples else None
+        steps.append(row)
+
+    return {
+        "users": results.started,
+        "completed": results.completed,
+        "failed": results.failed,
+        "duration_seconds": results.duration,
+        "arrival_rate": results.started / results.duration if results.duration else 0.0,
+        "throughput": results.completed / results.duration if results.duration else 0.0,
+        "steps": steps,
+    }
+
+
+def arrival_offsets(users, rate, arrival, seed=None):
+    randomizer = random.Random(seed)
+    offset = 0.0
+    for _ in range(users):
+        yield offset
+        offset += randomizer.expovariate(rate) if arrival == "poisson" else 1 / rate
+
+
+async def virtual_user(browser, options, results):
+    context = None
+    try:
+        context = await browser.new_context(base_url=options.base_url)
+        context.set_default_timeout(options.timeout)
+        await install_replay_async(context, "replay" if options.replay_archive else "off", options.replay_archive)
+        await PROFILES[options.browser_profile].install_async(context)
+        page = await context.new_page()
+        home_page = AsyncHomePage(page)
+        booking_page = AsyncBookingPage(page)
+
+        async with results.step("open"):
+            await page.goto("/")
+        async with results.step("destinations"):
+            await home_page.navigate_to_destinations_section()
+        async with results.step("book"):
+            await home_page.book_first_destination()
+            if not await booking_page.is_loaded(timeout=options.timeout):
+                raise AssertionError("Checkout page did not load.")
+        form = {"name": "John Doe", "email": "johndoe@example.com", "ssn": "123-45-6789", "phone": "13235993883",
+                "promo_code": options.promo_code}
+        if options.batched_fill:
+            async with results.step("fill_form"):
+                await booking_page.fill_form_batched(**form, agree_to_terms=True)
+        else:
+            async with results.step("fill_form"):
+                await booking_page.fill_form(**form)
+            async with results.step("agree_to_terms"):
+                await booking_page.agree_to_terms()
+        async with results.step("apply_promo"):
+            await booking_page.click_apply_button()
+        async with results.step("pay_now"):
+            await booking_page.click_pay_now()
+        if options.expect_confirmation:
+            async with results.step("confirmation"):
+                if not await booking_page.has_booking_action_occurred(timeout_ms=options.timeout):
+                    raise AssertionError("Paying did not lead to a confirmation or failure message.")
+        results.completed += 1
+    except Exception:
+        results.failed += 1
+    finally:
+        if context is not None:
+            await context.close()
+
+
+async def run_load(options):
+    results = LoadResults()
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(**PROFILES[options.browser_profile].launch_options())
+        slots = asyncio.Semaphore(options.concurrency)
+
+        async def arrive():
+            async with results.step("wait_for_slot"):
+                await slots.acquire()
+            try:
+                await virtual_user(browser, options, results)
+            finally:
+                slots.release()
+
+        started = time.perf_counter()
+        users = []
+        for offset in arrival_offsets(options.users, options.rate, options.arrival, options.seed):
+            await asyncio.sleep(max(0.0, started + offset - time.perf_counter()))
+            results.started += 1
+            users.append(asyncio.create_task(arrive()))
+        await asyncio.gather(*users)
+        results.duration = time.perf_counter() - started
+        await browser.close()
+    return results
+
+
+def write_report(path, summary):
+    path = Path(path)
+    if path.suffix == ".csv":
+        with path.open("w", newline="", encoding="utf-8") as report:
+            writer = csv.DictWriter(report, fieldnames=list(summary["steps"][0]))
+            writer.writeheader()
+            writer.writerows(summary["steps"])
+    else:
+        path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+
+def format_seconds(value):
+    return f"{value:.3f}" if value is not None else "-"
+
+
+def print_summary(summary):
+    print(f"{summary['users']} users in {summary['duration_seconds']:.1f}s "
+          f"({summary['arrival_rate']:.2f}/s arrived, {summary['throughput']:.2f}/s completed), "
+          f"{summary['completed']} completed, {summary['failed']} failed")
+    columns = ["mean", *(f"p{percent}" for percent in PERCENTILES), "max"]
+    print(f"{'step':<15} {'count':>6} {'errors':>6} " + " ".join(f"{column:>8}" for column in columns))
+    for row in summary["steps"]:
+        print(f"{row['step']:<15} {row['count']:>6} {row['errors']:>6} "
+              + " ".join(f"{format_seconds(row[column]):>8}" for column in columns))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m utils.load_runner",
+                                     description="Run virtual users through the destinations, book and checkout flow.")
+    parser.add_argument("--users", type=int, default=20, help="Total number of virtual users to start.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Virtual users running at the same time.")
+    parser.add_argument("--rate", type=float, default=2.0, help="Target arrival rate in users per second.")
+    parser.add_argument("--arrival", choices=ARRIVALS, default="constant",
+                        help="Evenly spaced arrivals, or exponential gaps around the target rate.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for poisson arrivals.")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL"), help="Application under load (BASE_URL).")
+    parser.add_argument("--replay-archive", default=None,
+                        help="Serve every request from a recorded archive instead of the network.")
+    parser.add_argument("--browser-profile", choices=sorted(PROFILES), default=os.getenv("BROWSER_PROFILE", "fast"))
+    parser.add_argument("--promo-code", default="PROMO2023")
+    parser.add_argument("--batched-fill", action="store_true",
+                        help="Fill the checkout form and agree to the terms in one in-page call; "
+                             "agree_to_terms is then part of the fill_form step.")
+    parser.add_argument("--expect-confirmation", action="store_true",
+                        help="Wait for a confirmation or failure message after paying and count users without one "
+                             "as failed. The demo app shows neither, so this is off by default.")
+    parser.add_argument("--timeout", type=float, default=30000, help="Timeout of every page action in milliseconds.")
+    parser.add_argument("--report", default="load_report.json", help="Report file, .csv writes the per-step table.")
+    options = parser.parse_args(argv)
+    if options.users < 1 or options.concurrency < 1 or options.rate <= 0:
+        parser.error("--users, --concurrency and --rate must be positive.")
+    if not options.base_url:
+        parser.error("--base-url or BASE_URL is required.")
+    return options
+
+
+def main(argv):
+    load_dotenv()
+    options = parse_args(argv)
+    summary = summarize(asyncio.run(run_load(options)))
+    write_report(options.report, summary)
+    print_summary(summary)
+    print(f"report written to {options.report}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
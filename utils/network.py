@@ -0,0 +1,107 @@
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Error
+
+SERVED_BY_HEADER = "x-easysend-served-by"
+EVENTS = ("request", "response", "requestfinished", "requestfailed")
+
+
+class NetworkRecorder:
+    def __init__(self, page):
+        self.page = page
+        self.requests = []
+        self.responses = {}
+        self.finished = set()
+        self.failed = {}
+        self._handlers = {
+            "request": self.requests.append,
+            "response": self._on_response,
+            "requestfinished": self.finished.add,
+            "requestfailed": self._on_failed,
+        }
+
+    def start(self):
+        for event, handler in self._handlers.items():
+            self.page.on(event, handler)
+
+    def stop(self):
+        for event, handler in self._handlers.items():
+            self.page.remove_listener(event, handler)
+
+    def _on_response(self, response):
+        self.responses[response.request] = response
+
+    def _on_failed(self, request):
+        self.failed[request] = request.failure
+
+    def entries(self):
+        entries = []
+        for request in self.requests:
+            response = self.responses.get(request)
+            entry = {
+                "url": request.url,
+                "method": request.method,
+                "resource_type": request.resource_type,
+                "status": response.status if response is not None else None,
+                "served_by": served_by(response),
+                "duration_ms": None,
+                "bytes": 0,
+                "state": "in flight",
+            }
+            if request in self.failed:
+                entry["state"] = f"failed: {self.failed[request]}"
+            elif request in self.finished:
+                entry["state"] = "finished"
+                entry["duration_ms"] = duration(request)
+                try:
+                    sizes = request.sizes()
+                    entry["bytes"] = sizes["responseBodySize"] + sizes["responseHeadersSize"]
+                except Error:
+                    pass
+            entries.append(entry)
+        return entries
+
+
+def served_by(response):
+    if response is None:
+        return None
+    if response.from_service_worker:
+        return "service-worker"
+    return response.headers.get(SERVED_BY_HEADER, "network")
+
+
+def duration(request):
+    timing = request.timing
+    if timing["responseEnd"] < 0:
+        return None
+    return round(timing["responseEnd"], 1)
+
+
+def url_key(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def format_bytes(size):
+    return f"{size / 1024 / 1024:.2f} MB" if size >= 1024 * 1024 else f"{size / 1024:.1f} kB"
+
+
+def summarize(entries, slowest=5):
+    total_bytes = sum(entry["bytes"] for entry in entries)
+    in_flight = [entry for entry in entries if entry["state"] == "in flight"]
+    failed = [entry for entry in entries if entry["state"].startswith("failed")]
+    timed = sorted((entry for entry in entries if entry["duration_ms"] is not None),
+                   key=lambda entry: entry["duration_ms"], reverse=True)
+
+    lines = [f"{len(entries)} requests, {format_bytes(total_bytes)} transferred, "
+             f"{len(in_flight)} in flight at teardown, {len(failed)} failed"]
+    if timed:
+        lines.append("slowest:")
+        lines.extend(f"  {entry['duration_ms']:>8.1f} ms  {entry['status']}  {entry['method']} {entry['resource_type']} "
+                     f"{entry['url']}  ({entry['served_by']}, {format_bytes(entry['bytes'])})"
+                     for entry in timed[:slowest])
+    for title, group in (("in flight:", in_flight), ("failed:", failed)):
+        if group:
+            lines.append(title)
+            lines.extend(f"  {entry['method']} {entry['resource_type']} {entry['url']}" for entry in group)
+    return "\n".join(lines)
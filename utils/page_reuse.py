@@ -0,0 +1,49 @@
+from playwright.sync_api import Error
+
+
+class PageReuse:
+    def __init__(self, pool, stats=None):
+        self.pool = pool
+        self._held = None
+        self.stats = stats if stats is not None else {}
+        for counter in ("reused", "reloaded"):
+            self.stats.setdefault(counter, 0)
+
+    def acquire(self, group, reset):
+        if self._held is not None and self._held[0] == group:
+            _, context, page = self._held
+            self._held = None
+            try:
+                if reset(page):
+                    self.stats["reused"] += 1
+                    return context, page
+                page.goto("/")
+                self.stats["reloaded"] += 1
+                return context, page
+            except Error:
+                self.pool.release(context, page)
+
+        self.release()
+        return self.pool.acquire()
+
+    def hold(self, group, context, page):
+        self.release()
+        self._held = (group, context, page)
+
+    def release(self):
+        if self._held is not None:
+            _, context, page = self._held
+            self._held = None
+            self.pool.release(context, page)
+
+
+def reuse_group(item):
+    if item.get_closest_marker("sweep") is not None:
+        return f"sweep:{item.module.__name__}.{item.originalname}"
+    marker = item.get_closest_marker("reuse_page")
+    return marker.kwargs.get("group", "read-only") if marker is not None else None
+
+
+def partition_groups(items):
+    return {item.nodeid: f"{item.module.__name__}.{item.originalname}" for item in items
+            if reuse_group(item) is not None}
@@ -0,0 +1,21 @@
+from decimal import Decimal, InvalidOperation
+
+
+def parse_price(text):
+    if text is None:
+        raise ValueError("Total price is missing.")
+    try:
+        return Decimal(text.strip().replace("$", "").replace(",", ""))
+    except InvalidOperation:
+        raise ValueError(f"Unexpected total price '{text}'.") from None
+
+
+class PriceChange:
+    def __init__(self, before):
+        self.before = before
+        self.after = None
+
+    @property
+    def changed(self):
+        return self.after is not None and self.after != self.before
+
@@ -0,0 +1,129 @@
+import functools
+import inspect
+import time
+
+from utils.wait_budget import budget
+
+COUNTED_CHANNEL_METHODS = ("send", "send_return_as_dict", "send_no_reply")
+
+
+class PlaywrightCallCounter:
+    def __init__(self):
+        self.count = 0
+        self._originals = {}
+
+    def install(self):
+        try:
+            from playwright._impl._connection import Channel
+        except ImportError:
+            return False
+
+        originals = {name: getattr(Channel, name, None) for name in COUNTED_CHANNEL_METHODS}
+        if not any(inspect.iscoroutinefunction(original) for original in originals.values()):
+            return False
+        for name, original in originals.items():
+            if not inspect.iscoroutinefunction(original) or name in self._originals:
+                continue
+            self._originals[name] = original
+            setattr(Channel, name, self._counting(original))
+        return True
+
+    def _counting(self, original):
+        if inspect.iscoroutinefunction(original):
+            @functools.wraps(original)
+            async def counted(*args, **kwargs):
+                self.count += 1
+                return await original(*args, **kwargs)
+        else:
+            @functools.wraps(original)
+            def counted(*args, **kwargs):
+                self.count += 1
+                return original(*args, **kwargs)
+        return counted
+
+
+class PageProfiler:
+    def __init__(self, stats=None):
+        self.stats = stats if stats is not None else {}
+        self.counter = PlaywrightCallCounter()
+        self.counts_calls = False
+
+    def install(self, *base_classes):
+        self.counts_calls = self.counter.install()
+        for base_class in base_classes:
+            for cls in all_subclasses(base_class):
+                self.instrument(cls)
+
+    def instrument(self, cls):
+        for name, value in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(value) or getattr(value, "__profiled__", False):
+                continue
+            setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", value))
+
+    def _record(self, key, started, waited, calls):
+        elapsed = time.perf_counter() - started
+        entry = self.stats.setdefault(key, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+                                            "wait_seconds": 0.0, "playwright_calls": 0})
+        entry["calls"] += 1
+        entry["total_seconds"] += elapsed
+        entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+        entry["wait_seconds"] += budget.waited - waited
+        entry["playwright_calls"] += self.counter.count - calls
+
+    def _wrap(self, key, function):
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def profiled(*args, **kwargs):
+                started, waited, calls = time.perf_counter(), budget.waited, self.counter.count
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    self._record(key, started, waited, calls)
+        else:
+            @functools.wraps(function)
+            def profiled(*args, **kwargs):
+                started, waited, calls = time.perf_counter(), budget.waited, self.counter.count
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self._record(key, started, waited, calls)
+
+        profiled.__profiled__ = True
+        return profiled
+
+
+def all_subclasses(cls):
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(all_subclasses(subclass))
+    return subclasses
+
+
+def summarize(stats):
+    methods = {}
+    for key, entry in stats.items():
+        calls = entry["calls"] or 1
+        methods[key] = {
+            **entry,
+            "mean_seconds": entry["total_seconds"] / calls,
+            "playwright_calls_per_call": entry["playwright_calls"] / calls,
+        }
+    return methods
+
+
+def find_regressions(methods, baseline, threshold, min_seconds=0.05):
+    regressions = []
+    for key, entry in methods.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        slower_by = entry["mean_seconds"] - previous["mean_seconds"]
+        if slower_by > min_seconds and entry["mean_seconds"] > previous["mean_seconds"] * (1 + threshold):
+            regressions.append({
+                "method": key,
+                "mean_seconds": entry["mean_seconds"],
+                "baseline_mean_seconds": previous["mean_seconds"],
+            })
+    return sorted(regressions, key=lambda regression: regression["mean_seconds"] - regression["baseline_mean_seconds"],
+                  reverse=True)
@@ -0,0 +1,71 @@
+import itertools
+import json
+import os
+import shutil
+from pathlib import Path
+
+REPLAY_MODES = ("off", "record", "replay")
+_recordings = itertools.count(1)
+
+
+def install_replay(context, mode, archive):
+    route_replay(context, mode, archive)
+
+
+async def install_replay_async(context, mode, archive):
+    routed = route_replay(context, mode, archive)
+    if routed is not None:
+        await routed
+
+
+def route_replay(context, mode, archive):
+    if mode not in REPLAY_MODES:
+        raise ValueError(f"Unknown replay mode '{mode}', expected one of {', '.join(REPLAY_MODES)}.")
+    if mode == "off":
+        return None
+
+    archive = Path(archive)
+    if mode == "record":
+        recording = recordings_dir(archive) / f"{os.getpid()}-{next(_recordings)}.har"
+        recording.parent.mkdir(parents=True, exist_ok=True)
+        return context.route_from_har(recording, update=True, update_content="embed", update_mode="full")
+
+    if not archive.exists():
+        raise FileNotFoundError(f"Replay archive '{archive}' does not exist, record it first with --replay=record.")
+    return context.route_from_har(archive, not_found="abort")
+
+
+def recordings_dir(archive):
+    archive = Path(archive)
+    return archive.with_name(f"{archive.stem}.recordings")
+
+
+def clear_recordings(archive):
+    shutil.rmtree(recordings_dir(archive), ignore_errors=True)
+
+
+def request_key(entry):
+    request = entry["request"]
+    return request["method"], request["url"], (request.get("postData") or {}).get("text")
+
+
+def merge_recordings(archive):
+    archive = Path(archive)
+    paths = sorted(recordings_dir(archive).glob("*.har"), key=lambda path: path.stat().st_mtime)
+    if not paths:
+        return 0
+
+    merged, pages, entries = None, [], {}
+    for path in paths:
+        log = json.loads(path.read_text(encoding="utf-8"))["log"]
+        merged = merged or log
+        pages.extend(log.get("pages", []))
+        for entry in log.get("entries", []):
+            entries.pop(request_key(entry), None)
+            entries[request_key(entry)] = entry
+
+    merged = dict(merged, pages=pages, entries=list(entries.values()))
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    archive.write_text(json.dumps({"log": merged}), encoding="utf-8")
+    clear_recordings(archive)
+    return len(entries)
@@ -0,0 +1,84 @@
+from playwright.sync_api import Error
+
+from pages.booking_page import BookingPage
+from pages.home_page import HomePage
+from pages.locators import LOCATOR_GROUPS, locator_specs
+from pages.login_page import LoginPage
+
+STATES = ("home", "date picker", "year list", "adults dropdown", "children dropdown", "destinations", "checkout",
+          "login form")
+SAMPLE_VALUES = {"year": "2024", "number": "2"}
+
+
+def prepare(page, state):
+    home_page = HomePage(page)
+    match state:
+        case "date picker":
+            home_page.open_date_picker("departing")
+        case "year list":
+            home_page.open_date_picker("departing")
+            home_page.years_button.click()
+        case "adults dropdown":
+            home_page.adults_dropdown.click()
+        case "children dropdown":
+            home_page.children_dropdown.click()
+        case "destinations":
+            home_page.navigate_to_destinations_section()
+        case "checkout":
+            home_page.navigate_to_destinations_section()
+            home_page.book_first_destination()
+            if not BookingPage(page).is_loaded():
+                raise AssertionError("Checkout page did not load.")
+        case "login form":
+            LoginPage(page).goto()
+
+
+def specs_by_state():
+    states = {state: [] for state in STATES}
+    for group in LOCATOR_GROUPS:
+        for name, spec in locator_specs(group).items():
+            states[spec.state or group.default_state].append((f"{group.__name__}.{name}", spec))
+    return states
+
+
+def count_matches(page, spec, timeout):
+    if spec.fields:
+        spec = spec.format(**SAMPLE_VALUES)
+    locator = spec.resolve(page)
+    if spec.required:
+        try:
+            locator.first.wait_for(state="attached", timeout=timeout)
+        except Error:
+            return 0
+    return locator.count()
+
+
+def validate_selectors(open_page, close_page, timeout=2000):
+    results = []
+    for state, specs in specs_by_state().items():
+        if not specs:
+            continue
+        context, page = open_page()
+        try:
+            prepare(page, state)
+        except (Error, AssertionError) as error:
+            results.extend({"state": state, "name": name, "selector": repr(spec), "required": spec.required,
+                            "count": None, "error": f"could not reach state: {str(error).splitlines()[0]}"}
+                           for name, spec in specs)
+            close_page(context, page)
+            continue
+
+        for name, spec in specs:
+            result = {"state": state, "name": name, "selector": repr(spec), "required": spec.required,
+                      "count": None, "error": None}
+            try:
+                result["count"] = count_matches(page, spec, timeout)
+            except Error as error:
+                result["error"] = str(error).splitlines()[0]
+            results.append(result)
+        close_page(context, page)
+    return results
+
+
+def broken(results):
+    return [result for result in results if result["required"] and not result["count"]]
@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+import sys
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+
+from utils.durations import partition
+
+DEFAULT_REPORT_DIR = "shard-reports"
+SUITE_COUNTERS = ("tests", "errors", "failures", "skipped")
+
+
+def shard_name(index, count):
+    return f"shard-{index}-of-{count}"
+
+
+def select(nodeids, durations, index, count, groups=None):
+    buckets = partition(nodeids, durations, count, groups)
+    return buckets[index - 1] if index <= len(buckets) else []
+
+
+def load_durations(path):
+    return {nodeid: float(seconds) for nodeid, seconds in json.loads(Path(path).read_text(encoding="utf-8")).items()}
+
+
+def outcome(result, report):
+    wasxfail = hasattr(report, "wasxfail")
+    if report.when == "call":
+        if wasxfail:
+            return "xfailed" if report.skipped else "xpassed"
+        return report.outcome
+    if report.failed:
+        return "error"
+    if report.skipped:
+        return "xfailed" if wasxfail else "skipped"
+    return result
+
+
+class ShardResults:
+    def __init__(self, index, count, estimates, collected=()):
+        self.index = index
+        self.count = count
+        self.estimates = estimates
+        self.collected = list(collected)
+        self.filtered = set()
+        self.tests = {}
+
+    def add(self, report):
+        test = self.tests.setdefault(report.nodeid, {"nodeid": report.nodeid, "outcome": "passed", "duration": 0.0,
+                                                     "estimate": self.estimates.get(report.nodeid), "longrepr": None})
+        test["duration"] += report.duration
+        if test["outcome"] in ("passed", "xpassed"):
+            test["outcome"] = outcome(test["outcome"], report)
+        if report.failed and test["longrepr"] is None:
+            test["longrepr"] = report.longreprtext
+
+    def as_dict(self):
+        return {
+            "shard": {"index": self.index, "count": self.count,
+                      "estimated_seconds": round(sum(self.estimates.values()), 3)},
+            "tests": list(self.tests.values()),
+            "collected": self.collected,
+            "filtered": sorted(self.filtered),
+        }
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+def merge_results(paths):
+    shards, tests, problems = {}, {}, []
+    collected, filtered = {}, set()
+    for path in paths:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        shard = data["shard"]
+        shards[shard["index"]] = shard
+        collected[shard["index"]] = set(data.get("collected", []))
+        filtered.update(data.get("filtered", []))
+        for test in data["tests"]:
+            if test["nodeid"] in tests:
+                problems.append(f"{test['nodeid']} ran in more than one shard")
+            tests[test["nodeid"]] = dict(test, shard=shard["index"])
+
+    counts = {shard["count"] for shard in shards.values()}
+    if len(counts) > 1:
+        problems.append(f"reports come from runs with different shard counts: {sorted(counts)}")
+    elif counts:
+        missing = sorted(set(range(1, counts.pop() + 1)) - set(shards))
+        if missing:
+            problems.append(f"missing reports for shards {', '.join(map(str, missing))}")
+
+    if len({frozenset(nodeids) for nodeids in collected.values()}) > 1:
+        problems.append("shards collected different tests")
+    not_run = sorted(set().union(*collected.values()) - set(tests) - filtered)
+    if not_run:
+        problems.append(f"{len(not_run)} collected tests ran in no shard: {', '.join(not_run)}")
+
+    outcomes = {}
+    for test in tests.values():
+        outcomes[test["outcome"]] = outcomes.get(test["outcome"], 0) + 1
+    durations = {}
+    for test in tests.values():
+        durations[test["shard"]] = durations.get(test["shard"], 0.0) + test["duration"]
+    summary = {
+        "tests": len(tests),
+        "outcomes": outcomes,
+        "shards": [dict(shards[index], seconds=round(durations.get(index, 0.0), 3)) for index in sorted(shards)],
+        "problems": problems,
+    }
+    return {"summary": summary, "tests": sorted(tests.values(), key=lambda test: test["nodeid"])}
+
+
+def merge_junit(paths):
+    merged = ElementTree.Element("testsuite", name="pytest")
+    totals = dict.fromkeys(SUITE_COUNTERS, 0)
+    time = 0.0
+    for path in paths:
+        root = ElementTree.parse(path).getroot()
+        for suite in root.iter("testsuite"):
+            for counter in SUITE_COUNTERS:
+                totals[counter] += int(suite.get(counter, 0))
+            time += float(suite.get("time", 0))
+            merged.extend(suite.findall("testcase"))
+    merged.attrib.update({counter: str(value) for counter, value in totals.items()}, time=f"{time:.3f}")
+    testsuites = ElementTree.Element("testsuites")
+    testsuites.append(merged)
+    return ElementTree.ElementTree(testsuites)
+
+
+def merge(directory, output):
+    directory, output = Path(directory), Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    result_paths = sorted(directory.glob("shard-*.json"))
+    junit_paths = sorted(directory.glob("shard-*.xml"))
+    if not result_paths and not junit_paths:
+        raise FileNotFoundError(f"no shard reports in {directory}")
+
+    merged = merge_results(result_paths)
+    (output / "report.json").write_text(json.dumps(merged, indent=2), encoding="utf-8")
+    durations = {test["nodeid"]: round(test["duration"], 3) for test in merged["tests"]}
+    (output / "durations.json").write_text(json.dumps(durations, indent=2, sort_keys=True), encoding="utf-8")
+    if junit_paths:
+        tree = merge_junit(junit_paths)
+        ElementTree.indent(tree)
+        tree.write(output / "junit.xml", encoding="utf-8", xml_declaration=True)
+    return merged["summary"]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m utils.shards", description="Combine the reports of a sharded run.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge_parser = commands.add_parser("merge", help="Merge the per-shard JSON and JUnit reports into one.")
+    merge_parser.add_argument("directory", nargs="?", default=os.getenv("SHARD_REPORT_DIR", DEFAULT_REPORT_DIR),
+                              help="Directory with the shard-*.json and shard-*.xml files of every shard.")
+    merge_parser.add_argument("--output", default=None,
+                              help="Directory the report.json, junit.xml and durations.json are written to "
+                                   "(default: the shard report directory).")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    options = parse_args(argv)
+    try:
+        summary = merge(options.directory, options.output or options.directory)
+    except FileNotFoundError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    outcomes = ", ".join(f"{count} {name}" for name, count in sorted(summary["outcomes"].items()))
+    print(f"{summary['tests']} tests from {len(summary['shards'])} shards: {outcomes or 'none'}")
+    for shard in summary["shards"]:
+        print(f"  shard {shard['index']}/{shard['count']}: {shard['seconds']:.1f}s "
+              f"(estimated {shard['estimated_seconds']:.1f}s)")
+    for problem in summary["problems"]:
+        print(f"problem: {problem}", file=sys.stderr)
+    failed = summary["outcomes"].get("failed", 0) + summary["outcomes"].get("error", 0)
+    return 1 if summary["problems"] or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
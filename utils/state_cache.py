@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+MAX_RESTORE_FAILURES = 2
+SESSION_STORAGE_SCRIPT = "() => Object.fromEntries(Object.entries(sessionStorage))"
+RESTORE_STORAGE_SCRIPT = """([localItems, sessionItems]) => {
+    localItems.forEach(({name, value}) => localStorage.setItem(name, value));
+    Object.entries(sessionItems).forEach(([name, value]) => sessionStorage.setItem(name, value));
+}"""
+
+
+class StorageStateCache:
+    def __init__(self, directory, max_age=None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+
+    def _path(self, key, prefix="state"):
+        return self.directory / f"{prefix}-{hashlib.sha256(key.encode()).hexdigest()[:20]}.json"
+
+    def _write(self, path, data):
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temp_path, path)
+
+    def _read(self, key):
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("key") != key:
+            return None
+        if self.max_age is not None and time.time() - entry["saved_at"] > self.max_age:
+            return None
+        return entry
+
+    def load(self, key, **metadata):
+        entry = self._read(key)
+        if entry is None or entry.get("failures", 0) >= MAX_RESTORE_FAILURES:
+            return None
+        if any(entry.get(name) != value for name, value in metadata.items()):
+            return None
+        return entry
+
+    def save(self, key, snapshot, failures=0, **metadata):
+        entry = {"key": key, "saved_at": time.time(), "failures": failures, "snapshot": snapshot, **metadata}
+        self._write(self._path(key), entry)
+        return entry
+
+    def refresh(self, key, snapshot, restore_failed=False, **metadata):
+        entry = self._read(key)
+        failures = 0
+        if entry is not None and all(entry.get(name) == value for name, value in metadata.items()):
+            failures = entry.get("failures", 0)
+
+        if restore_failed:
+            failures += 1
+        elif failures >= MAX_RESTORE_FAILURES:
+            return None
+        return self.save(key, snapshot, failures=failures, **metadata)
+
+    def invalidate(self, key):
+        self._path(key).unlink(missing_ok=True)
+
+    def get_shape(self, scope):
+        try:
+            return json.loads(self._path(scope, prefix="shape").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def set_shape(self, scope, shape):
+        self._write(self._path(scope, prefix="shape"), shape)
+
+
+def take_snapshot(page):
+    return {"state": page.context.storage_state(), "session_storage": page.evaluate(SESSION_STORAGE_SCRIPT)}
+
+
+def session_shape(snapshot):
+    state = snapshot["state"]
+    shape = {f"cookie:{cookie['name']}" for cookie in state.get("cookies", [])}
+    shape.update(f"local:{item['name']}" for origin in state.get("origins", [])
+                 for item in origin.get("localStorage", []))
+    shape.update(f"session:{name}" for name in snapshot.get("session_storage", {}))
+    return sorted(shape)
+
+
+def apply_storage_state(page, snapshot):
+    state = snapshot["state"]
+    if state.get("cookies"):
+        page.context.add_cookies(state["cookies"])
+
+    origin = page.evaluate("() => location.origin")
+    local_items = [item for stored_origin in state.get("origins", []) if stored_origin["origin"] == origin
+                   for item in stored_origin.get("localStorage", [])]
+    page.evaluate(RESTORE_STORAGE_SCRIPT, [local_items, snapshot.get("session_storage", {})])
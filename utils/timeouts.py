@@ -0,0 +1,86 @@
+import json
+import math
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+MIN_SAMPLES = 20
+KEPT_SAMPLES = 200
+HISTORY_MAX_AGE = 14 * 24 * 3600
+MIN_TIMEOUT_MS = 250
+MAX_TIMEOUT_MS = 30000
+
+
+class TimeoutService:
+    def __init__(self):
+        self.directory = None
+        self.name = None
+        self.enabled = False
+        self.percentile = 99
+        self.margin = 1.5
+        self.history = {}
+        self.observed = {}
+        self.defaults = {}
+
+    def configure(self, directory, name, enabled=True, percentile=99, margin=1.5):
+        self.directory = Path(directory)
+        self.name = name
+        self.enabled = enabled
+        self.percentile = percentile
+        self.margin = margin
+        self.history = {}
+        self.observed = {}
+        for path in self.directory.glob("*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if time.time() - data.get("saved_at", 0) > HISTORY_MAX_AGE:
+                continue
+            for key, samples in data.get("samples", {}).items():
+                self.history.setdefault(key, []).extend(samples)
+
+    def samples(self, key):
+        return [*self.history.get(key, []), *self.observed.get(key, [])]
+
+    def learned(self, key):
+        samples = self.samples(key)
+        if len(samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        high = ordered[max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)]
+        return round(min(MAX_TIMEOUT_MS, max(MIN_TIMEOUT_MS, high * self.margin)))
+
+    def timeout(self, key, default):
+        self.defaults[key] = default
+        learned = self.learned(key) if self.enabled else None
+        return default if learned is None else learned
+
+    def observe(self, key, elapsed_ms):
+        self.observed.setdefault(key, []).append(round(elapsed_ms, 1))
+
+    @contextmanager
+    def measure(self, key, default, timeout=None):
+        chosen = self.timeout(key, default) if timeout is None else timeout
+        started = time.perf_counter()
+        yield chosen
+        self.observe(key, (time.perf_counter() - started) * 1000)
+
+    def save(self):
+        if self.directory is None or not self.observed:
+            return
+        path = self.directory / f"{self.name}.json"
+        try:
+            previous = json.loads(path.read_text(encoding="utf-8")).get("samples", {})
+        except (OSError, ValueError):
+            previous = {}
+        for key, samples in self.observed.items():
+            previous[key] = [*previous.get(key, []), *samples][-KEPT_SAMPLES:]
+
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps({"saved_at": time.time(), "samples": previous}), encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+timeouts = TimeoutService()
@@ -0,0 +1,33 @@
+import time
+from contextlib import contextmanager
+
+
+class WaitBudget:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.waited = 0.0
+        self.waits = 0
+        self._depth = 0
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @contextmanager
+    def waiting(self):
+        if self._depth:
+            yield
+            return
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.waited += time.perf_counter() - start
+            self.waits += 1
+            self._depth -= 1
+
+
+budget = WaitBudget()
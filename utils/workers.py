@@ -0,0 +1,24 @@
+import os
+
+WORKER_ENV = "EASYSEND_WORKER"
+
+worker_stats = {}
+
+
+def worker_id():
+    return os.getenv(WORKER_ENV, "main")
+
+
+def is_worker():
+    return WORKER_ENV in os.environ
+
+
+def merge_stats(target, source):
+    for name, value in source.items():
+        if isinstance(value, dict):
+            merge_stats(target.setdefault(name, {}), value)
+        elif name.startswith("max_"):
+            target[name] = max(target.get(name, value), value)
+        else:
+            target[name] = target.get(name, 0) + value
+    return target